@@ -1525,6 +1525,7 @@ def render_video_cmd(
             crf=cfg.style.crf,
             render_concurrency=cfg.video.render_concurrency,
             render_timeout_seconds=cfg.video.render_timeout_seconds,
+            render_chunks=cfg.video.render_chunks,
         )
 
         render_video_with_remotion(
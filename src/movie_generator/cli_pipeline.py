@@ -932,6 +932,7 @@ def stage_video_rendering(
             crf=params.config.style.crf,
             render_concurrency=params.config.video.render_concurrency,
             render_timeout_seconds=params.config.video.render_timeout_seconds,
+            render_chunks=params.config.video.render_chunks,
         )
 
         render_video_with_remotion(
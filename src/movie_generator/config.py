@@ -313,6 +313,14 @@ class VideoConfig(BaseModel):
         ge=ConfigDefaults.VIDEO_RENDER_TIMEOUT_MIN,
         description="Timeout for Remotion delayRender calls in seconds",
     )
+    render_chunks: int = Field(
+        default=ConfigDefaults.VIDEO_RENDER_CHUNKS,
+        ge=ConfigDefaults.VIDEO_RENDER_CHUNKS_MIN,
+        description=(
+            "Number of frame ranges rendered by parallel Remotion processes "
+            "and joined with ffmpeg (1 = single process)"
+        ),
+    )
 
 
 class PronunciationWord(BaseModel):
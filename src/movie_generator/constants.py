@@ -155,6 +155,8 @@ class ConfigDefaults:
     VIDEO_RENDER_CONCURRENCY_MIN = 1  # Inclusive minimum (ge=1)
     VIDEO_RENDER_TIMEOUT = 300  # seconds
     VIDEO_RENDER_TIMEOUT_MIN = 1  # Inclusive minimum (ge=1)
+    VIDEO_RENDER_CHUNKS = 1  # 1 = single Remotion process
+    VIDEO_RENDER_CHUNKS_MIN = 1  # Inclusive minimum (ge=1)
 
     # Transition defaults
     TRANSITION_TYPE = "fade"
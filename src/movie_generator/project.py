@@ -3,6 +3,7 @@
 Handles project creation, asset management, and Remotion integration.
 """
 
+import hashlib
 import json
 import os
 import shutil
@@ -11,14 +12,22 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import TypeAdapter
 from rich.console import Console
 
 from .config import Config
 from .constants import ProjectPaths
 from .script.phrases import Phrase
+from .utils.serialization import dumps_json_bytes
 
 console = Console()
 
+# Sentinel recording the source character assets last copied into a project
+CHARACTER_ASSETS_SIGNATURE_FILENAME = ".source_signature"
+
+# Validates/serializes phrases.json directly from/to UTF-8 JSON bytes
+_PHRASE_LIST_ADAPTER = TypeAdapter(list[Phrase])
+
 
 def _ensure_pnpm_available() -> None:
     """Check if pnpm is available on the system.
@@ -206,9 +215,7 @@ class Project:
         if not self.phrases_file.exists():
             raise FileNotFoundError(f"Phrases file not found: {self.phrases_file}")
 
-        with self.phrases_file.open("r", encoding="utf-8") as f:
-            phrases_data = json.load(f)
-            return [Phrase.model_validate(p) for p in phrases_data]
+        return _PHRASE_LIST_ADAPTER.validate_json(self.phrases_file.read_bytes())
 
     def save_phrases(self, phrases: list[Phrase]) -> None:
         """Save phrases data.
@@ -216,9 +223,8 @@ class Project:
         Args:
             phrases: List of Phrase objects.
         """
-        with self.phrases_file.open("w", encoding="utf-8") as f:
-            phrases_data = [p.model_dump() for p in phrases]
-            json.dump(phrases_data, f, ensure_ascii=False, indent=2)
+        # Serialize straight to UTF-8 bytes (no text-mode encoding pass)
+        self.phrases_file.write_bytes(_PHRASE_LIST_ADAPTER.dump_json(phrases, indent=2))
 
     def copy_character_assets(self, source_root: Path | None = None) -> None:
         """Copy character assets from source to project assets directory.
@@ -234,17 +240,32 @@ class Project:
         if not source_characters.exists():
             return
 
-        # Copy all character directories
-        for character_dir in source_characters.iterdir():
-            if character_dir.is_dir():
-                dest_dir = self.characters_dir / character_dir.name
-                dest_dir.mkdir(parents=True, exist_ok=True)
+        # Skip the copy when source assets are unchanged since the last call
+        # (scene-range re-renders reuse the same project directory). The
+        # signature covers every file's path, size and mtime.
+        source_pngs = sorted(source_characters.glob("*/*.png"))
+        signature_hash = hashlib.blake2b(digest_size=16)
+        for png_file in source_pngs:
+            src_stat = png_file.stat()
+            signature_hash.update(
+                f"{png_file.relative_to(source_characters)}:{src_stat.st_size}:"
+                f"{src_stat.st_mtime_ns}\n".encode()
+            )
+        signature = signature_hash.hexdigest()
+        signature_file = self.characters_dir / CHARACTER_ASSETS_SIGNATURE_FILENAME
+        if signature_file.exists() and signature_file.read_text(encoding="utf-8") == signature:
+            return
+
+        # Copy missing PNG files; existing ones may have been customised for
+        # this project and are never overwritten
+        for png_file in source_pngs:
+            dest_file = self.characters_dir / png_file.parent.name / png_file.name
+            if not dest_file.exists():
+                dest_file.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(png_file, dest_file)
 
-                # Copy all PNG files
-                for png_file in character_dir.glob("*.png"):
-                    dest_file = dest_dir / png_file.name
-                    if not dest_file.exists():
-                        shutil.copy2(png_file, dest_file)
+        self.characters_dir.mkdir(parents=True, exist_ok=True)
+        signature_file.write_text(signature, encoding="utf-8")
 
     def copy_to_remotion(self, remotion_dir: Path | None = None) -> None:
         """Copy project assets to Remotion public directory.
@@ -361,9 +382,9 @@ class Project:
             )
 
             # tsconfig.json
-            tsconfig_path = remotion_dir / "tsconfig.json"
-            with tsconfig_path.open("w", encoding="utf-8") as f:
-                json.dump(video.templates.get_tsconfig_json(), f, indent=2)
+            (remotion_dir / "tsconfig.json").write_text(
+                video.templates.get_tsconfig_json_str(), encoding="utf-8"
+            )
 
             console.print("[green]✓ TypeScript components generated[/green]")
         except Exception as e:
@@ -536,8 +557,7 @@ class Project:
                 }
 
             composition_path = remotion_dir / "composition.json"
-            with composition_path.open("w", encoding="utf-8") as f:
-                json.dump(composition_data, f, indent=2)
+            composition_path.write_bytes(dumps_json_bytes(composition_data))
 
             console.print("[green]✓ Composition file created[/green]")
         except Exception as e:
@@ -590,9 +610,9 @@ class Project:
             if not remotion_installed:
                 console.print("[cyan]Installing Remotion dependencies...[/cyan]")
                 # Update package.json with correct dependencies
-                package_data = video.templates.get_package_json(self.name)
-                with package_json_path.open("w", encoding="utf-8") as f:
-                    json.dump(package_data, f, indent=2)
+                package_json_path.write_text(
+                    video.templates.get_package_json_str(self.name), encoding="utf-8"
+                )
                 try:
                     subprocess.run(
                         ["pnpm", "install"],
@@ -0,0 +1,34 @@
+import React from 'react';
+import { Composition } from 'remotion';
+import { VideoGenerator, calculateTotalFrames } from './VideoGenerator';
+import compositionData from '../composition.json';
+
+// Inject global styles for font loading
+const styles = `
+  @font-face {
+    font-family: 'Noto Sans JP';
+    src: local('Noto Sans JP'), local('Noto Sans CJK JP');
+    font-display: swap;
+  }
+`;
+
+export const RemotionRoot: React.FC = () => {
+  const totalFrames = React.useMemo(() => calculateTotalFrames(compositionData.phrases), []);
+
+  return (
+    <>
+      <style>{styles}</style>
+      <Composition
+        id="VideoGenerator"
+        component={VideoGenerator}
+        durationInFrames={totalFrames}
+        fps={compositionData.fps}
+        width={compositionData.width}
+        height={compositionData.height}
+        defaultProps={{
+          phrases: compositionData.phrases
+        }}
+      />
+    </>
+  );
+};
@@ -0,0 +1,807 @@
+import React from 'react';
+import { AbsoluteFill, Audio, Img, Loop, OffthreadVideo, Sequence, interpolate, staticFile, useCurrentFrame, useVideoConfig } from 'remotion';
+import { TransitionSeries, springTiming, linearTiming } from '@remotion/transitions';
+import { fade } from '@remotion/transitions/fade';
+import { slide } from '@remotion/transitions/slide';
+import { wipe } from '@remotion/transitions/wipe';
+import { flip } from '@remotion/transitions/flip';
+import { clockWipe } from '@remotion/transitions/clock-wipe';
+import { none } from '@remotion/transitions/none';
+import compositionData from '../composition.json';
+
+// Type definition for phrase metadata
+export interface PhraseData {
+  text: string;
+  audioFile: string;
+  slideFile?: string;
+  duration: number;
+  start_time?: number;  // Start time in seconds (for speaker pauses)
+  personaId?: string;
+  personaName?: string;
+  subtitleColor?: string;
+  characterImage?: string;
+  characterPosition?: 'left' | 'right' | 'center';
+  mouthOpenImage?: string;
+  eyeCloseImage?: string;
+  animationStyle?: 'bounce' | 'sway' | 'static';
+  backgroundOverride?: {
+    type: 'image' | 'video';
+    path: string;
+    fit?: 'cover' | 'contain' | 'fill';
+  };
+}
+
+// Props interface
+export interface VideoGeneratorProps {
+  phrases: PhraseData[];
+}
+
+// Calculate timing for each phrase
+// Note: If start_time is provided (for speaker pauses), use it directly.
+// Otherwise, calculate continuous timing based on duration.
+// Audio sequences use the provided timing (with pauses between speakers).
+// Transitions create visual overlap between slides, but audio plays continuously.
+// The total video duration accounts for transition overlaps in calculateTotalFrames().
+const getScenesWithTiming = (phrases: PhraseData[]) => {
+  const fps = (compositionData as any).fps || 30;
+  const usedIds = new Set<string>();
+  // Running sum of the durations of all previous phrases
+  let elapsedSeconds = 0;
+
+  return phrases.map((phrase, index) => {
+    // Use start_time if provided (e.g., with speaker pauses), otherwise calculate
+    const startFrame = phrase.start_time !== undefined
+      ? Math.round(phrase.start_time * fps)
+      : Math.round(elapsedSeconds * fps);
+    elapsedSeconds += phrase.duration;
+    const durationFrames = Math.round(phrase.duration * fps);
+
+    // Content-based key so React keeps a phrase's Sequence (and its Audio)
+    // mounted when phrases are inserted or reordered; the index only
+    // disambiguates duplicates
+    let id = phrase.audioFile ? `${phrase.audioFile}@${startFrame}` : `phrase-${index}`;
+    if (usedIds.has(id)) {
+      id = `${id}#${index}`;
+    }
+    usedIds.add(id);
+
+    const scene = {
+      id,
+      audioFile: phrase.audioFile,
+      subtitle: phrase.text,
+      slideFile: phrase.slideFile,
+      startFrame,
+      durationFrames,
+      endFrame: startFrame + durationFrames,
+      personaId: phrase.personaId,
+      personaName: phrase.personaName,
+      subtitleColor: phrase.subtitleColor,
+      characterImage: phrase.characterImage,
+      characterPosition: phrase.characterPosition,
+      mouthOpenImage: phrase.mouthOpenImage,
+      eyeCloseImage: phrase.eyeCloseImage,
+      animationStyle: phrase.animationStyle,
+    };
+    return scene;
+  });
+};
+
+// Helper to group consecutive scenes with the same slide
+// Build slide groups with transition compensation
+// TransitionSeries causes slides to overlap during transitions, so we need to
+// extend each slide's duration to compensate for the transition time that gets
+// "consumed" by the overlap. Without this, slides appear to change before
+// the audio for that section finishes.
+const getSlideGroups = (
+  scenes: ReturnType<typeof getScenesWithTiming>,
+  transitionDurationFrames: number = 0
+) => {
+  const groups: Array<{
+    slideFile?: string;
+    scenes: ReturnType<typeof getScenesWithTiming>;
+    durationFrames: number;
+  }> = [];
+
+  if (scenes.length === 0) return groups;
+
+  // In TransitionSeries, the transition duration is shared between adjacent slides,
+  // effectively shortening each slide's visible time. By adding the full transition
+  // duration to each non-final slide as its group is closed, we ensure the slide
+  // remains visible for the full duration of its associated audio.
+  let currentScenes: typeof scenes = [];
+
+  scenes.forEach((scene, index) => {
+    if (index > 0 && scene.slideFile !== currentScenes[0].slideFile) {
+      // Slide changed, save previous group
+      // Calculate duration from first scene's start to NEXT scene's start
+      // This includes all pauses (speaker and slide) until the next slide begins
+      const firstScene = currentScenes[0];
+      groups.push({
+        slideFile: firstScene.slideFile,
+        scenes: currentScenes,
+        durationFrames: scene.startFrame - firstScene.startFrame + transitionDurationFrames,
+      });
+      currentScenes = [];
+    }
+    currentScenes.push(scene);
+  });
+
+  // For the last group, extend duration by 1 second
+  // to keep the final slide visible after audio ends
+  const firstScene = currentScenes[0];
+  const lastScene = currentScenes[currentScenes.length - 1];
+  const fps = (compositionData as any).fps || 30;
+  const endingPauseFrames = fps; // 1.0 second
+  groups.push({
+    slideFile: firstScene.slideFile,
+    scenes: currentScenes,
+    durationFrames: lastScene.endFrame - firstScene.startFrame + endingPauseFrames,
+  });
+
+  return groups;
+};
+
+// Sorted, non-overlapping [starts[i], ends[i]) frame intervals
+interface SpeakingIntervals {
+  starts: Int32Array;
+  ends: Int32Array;
+}
+
+// Build each persona's speaking intervals as sorted, non-overlapping
+// [startFrame, endFrame) pairs so lookups can binary search instead of
+// scanning every scene on every frame
+const getSpeakingIntervals = (scenes: ReturnType<typeof getScenesWithTiming>) => {
+  const intervalsByPersona = new Map<string, Array<[number, number]>>();
+
+  scenes.forEach((scene) => {
+    if (!scene.personaId) return;
+    let intervals = intervalsByPersona.get(scene.personaId);
+    if (!intervals) {
+      intervals = [];
+      intervalsByPersona.set(scene.personaId, intervals);
+    }
+    intervals.push([scene.startFrame, scene.endFrame]);
+  });
+
+  // Merge overlaps and pack into parallel typed arrays for the per-frame search
+  const packedByPersona = new Map<string, SpeakingIntervals>();
+  intervalsByPersona.forEach((intervals, personaId) => {
+    intervals.sort((a, b) => a[0] - b[0]);
+    const starts = new Int32Array(intervals.length);
+    const ends = new Int32Array(intervals.length);
+    let count = 0;
+    intervals.forEach(([start, end]) => {
+      if (count > 0 && start <= ends[count - 1]) {
+        ends[count - 1] = Math.max(ends[count - 1], end);
+      } else {
+        starts[count] = start;
+        ends[count] = end;
+        count++;
+      }
+    });
+    packedByPersona.set(personaId, {
+      starts: starts.subarray(0, count),
+      ends: ends.subarray(0, count),
+    });
+  });
+
+  return packedByPersona;
+};
+
+// Binary search for the interval containing frame
+const isFrameInIntervals = (intervals: SpeakingIntervals | undefined, frame: number) => {
+  if (!intervals) return false;
+  const { starts, ends } = intervals;
+  let low = 0;
+  let high = starts.length - 1;
+  while (low <= high) {
+    const mid = (low + high) >> 1;
+    if (frame < starts[mid]) {
+      high = mid - 1;
+    } else if (frame >= ends[mid]) {
+      low = mid + 1;
+    } else {
+      return true;
+    }
+  }
+  return false;
+};
+
+// Get transition presentation based on type
+const getTransitionPresentation = (type: string) => {
+  switch (type) {
+    case 'fade':
+      return fade();
+    case 'slide':
+      return slide();
+    case 'wipe':
+      return wipe();
+    case 'flip':
+      return flip();
+    case 'clockWipe':
+      return clockWipe();
+    case 'none':
+      return none();
+    default:
+      return fade();
+  }
+};
+
+// Get transition timing based on configuration
+const getTransitionTiming = (timing: string, durationInFrames: number) => {
+  if (timing === 'spring') {
+    return springTiming({ config: { damping: 200 } });
+  }
+  return linearTiming({ durationInFrames });
+};
+
+// BackgroundLayer component
+// Uses OffthreadVideo with Loop for smooth video background playback
+// Memoized: it has no frame dependency, so it only re-renders when its props change
+const BackgroundLayer = React.memo<{
+  type?: 'image' | 'video';
+  path?: string;
+  fit?: 'cover' | 'contain' | 'fill';
+  loopDurationInFrames?: number;
+}>(({ type, path, fit = 'cover', loopDurationInFrames = 150 }) => {
+  if (!path) {
+    // No background configured - return black background
+    return <AbsoluteFill style={{ backgroundColor: '#000000' }} />;
+  }
+
+  const objectFit = fit === 'fill' ? 'fill' : fit;
+
+  if (type === 'video') {
+    // Use Loop + OffthreadVideo for smooth looping
+    // OffthreadVideo extracts frames using FFmpeg for accurate frame rendering
+    return (
+      <AbsoluteFill>
+        <Loop durationInFrames={loopDurationInFrames}>
+          <OffthreadVideo
+            src={staticFile(path)}
+            style={{
+              width: '100%',
+              height: '100%',
+              objectFit: objectFit,
+            }}
+            muted
+          />
+        </Loop>
+      </AbsoluteFill>
+    );
+  }
+
+  // Default to image
+  return (
+    <AbsoluteFill>
+      <Img
+        src={staticFile(path)}
+        style={{
+          width: '100%',
+          height: '100%',
+          objectFit: objectFit,
+        }}
+      />
+    </AbsoluteFill>
+  );
+});
+
+// Memoized: a slide only re-renders when its file changes
+const SlideLayer = React.memo<{
+  slideFile?: string;
+}>(({ slideFile }) => {
+  if (!slideFile) {
+    return (
+      <AbsoluteFill
+        style={{
+          display: 'flex',
+          alignItems: 'center',
+          justifyContent: 'center',
+          color: 'white',
+          fontSize: '48px',
+          fontFamily: 'Arial, sans-serif',
+        }}
+      >
+        <div>なんでも解説動画ジェネレーター</div>
+      </AbsoluteFill>
+    );
+  }
+
+  return (
+    <AbsoluteFill
+      style={{
+        display: 'flex',
+        alignItems: 'center',
+        justifyContent: 'center',
+      }}
+    >
+      <div style={{ width: '80%', height: '80%', display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
+        <Img
+          src={staticFile(slideFile)}
+          style={{
+            maxWidth: '100%',
+            maxHeight: '100%',
+            objectFit: 'contain',
+          }}
+        />
+      </div>
+    </AbsoluteFill>
+  );
+});
+
+const MOUTH_OPEN_FLAG = 1;
+const BLINKING_FLAG = 2;
+
+// Phase 2: Lip sync and blinking state for a frame as MOUTH_OPEN_FLAG | BLINKING_FLAG
+const getAnimationState = (frame: number, fps: number) => {
+  // Lip sync: Rapid mouth movement during speech for natural animation
+  // Use 2-frame intervals (0.067s at 30fps) for visible but smooth mouth movement
+  const lipSyncFrameInterval = Math.max(1, Math.floor(fps * 0.067)); // 2 frames at 30fps
+  const lipSyncCycle = Math.floor(frame / lipSyncFrameInterval) % 4; // 4-state cycle
+  // Mouth open for 3 out of 4 states (75%) during speech for more visible animation
+  const mouthOpen = lipSyncCycle !== 1 ? MOUTH_OPEN_FLAG : 0;
+
+  // Blinking: Blink every 2-4 seconds for 0.2 seconds
+  const blinkInterval = fps * 3; // 3 seconds between blinks
+  const blinkDuration = Math.floor(fps * 0.2); // 0.2 second blink
+  const blinking = frame % blinkInterval < blinkDuration ? BLINKING_FLAG : 0;
+
+  return mouthOpen | blinking;
+};
+
+const greatestCommonDivisor = (a: number, b: number): number =>
+  b === 0 ? a : greatestCommonDivisor(b, a % b);
+
+// Precompute getAnimationState over one full lip sync + blink period (the
+// least common multiple of both cycles) so each frame is a single table read.
+// Non-integer frame rates have no whole-frame period and return null.
+const getAnimationStateTable = (fps: number): Uint8Array | null => {
+  if (!Number.isInteger(fps) || fps <= 0) return null;
+  const lipSyncPeriod = Math.max(1, Math.floor(fps * 0.067)) * 4;
+  const blinkInterval = fps * 3;
+  const period =
+    (lipSyncPeriod / greatestCommonDivisor(lipSyncPeriod, blinkInterval)) * blinkInterval;
+  const table = new Uint8Array(period);
+  for (let frame = 0; frame < period; frame++) {
+    table[frame] = getAnimationState(frame, fps);
+  }
+  return table;
+};
+
+// Phase 3: Sway offsets (±5px, 2-second cycle) for every frame of one cycle, so
+// swaying characters read a table instead of calling Math.sin on every frame.
+// Non-integer frame rates have no whole-frame cycle and return null.
+const getSwayTable = (fps: number): Float64Array | null => {
+  if (!Number.isInteger(fps) || fps <= 0) return null;
+  const period = fps * 2;
+  const table = new Float64Array(period);
+  for (let frame = 0; frame < period; frame++) {
+    table[frame] = Math.sin((frame / fps) * Math.PI) * 5;
+  }
+  return table;
+};
+
+// CharacterFace renders the frame-dependent part of a character: lip sync,
+// blinking and the sway/bounce animation. It is the only character component
+// that needs to re-render on every frame.
+const CharacterFace: React.FC<{
+  characterImage: string;
+  mouthOpenImage?: string;
+  eyeCloseImage?: string;
+  animationStyle: 'bounce' | 'sway' | 'static';
+  isSpeaking: boolean;
+  fps: number;
+}> = ({ characterImage, mouthOpenImage, eyeCloseImage, animationStyle, isSpeaking, fps }) => {
+  const frame = useCurrentFrame();
+
+  const swayTable = React.useMemo(
+    () => (animationStyle === 'sway' ? getSwayTable(fps) : null),
+    [animationStyle, fps]
+  );
+
+  // Phase 3: Animation transform (sway/bounce)
+  const getAnimationTransform = () => {
+    if (animationStyle === 'static') {
+      return '';
+    }
+
+    const time = frame / fps;
+
+    if (animationStyle === 'sway') {
+      // Gentle side-to-side sway (2-second cycle)
+      const swayAmount = swayTable
+        ? swayTable[frame % swayTable.length]
+        : Math.sin(time * Math.PI) * 5; // ±5px
+      return `translateX(${swayAmount}px)`;
+    }
+
+    if (animationStyle === 'bounce') {
+      // Vertical bounce (1.5-second cycle)
+      const bounceAmount = Math.abs(Math.sin(time * Math.PI * 1.333)) * 10; // 0-10px
+      return `translateY(-${bounceAmount}px)`;
+    }
+
+    return '';
+  };
+
+  // Phase 2: Lip sync and blinking, read from a per-fps lookup table
+  const animationStateTable = React.useMemo(() => getAnimationStateTable(fps), [fps]);
+  const animationState = animationStateTable
+    ? animationStateTable[frame % animationStateTable.length]
+    : getAnimationState(frame, fps);
+  const isMouthOpen = isSpeaking && (animationState & MOUTH_OPEN_FLAG) !== 0;
+  const isBlinking = (animationState & BLINKING_FLAG) !== 0;
+
+  // Determine which image to display
+  let currentImage = characterImage;
+
+  // Priority: blinking overrides mouth state
+  if (isBlinking && eyeCloseImage) {
+    currentImage = eyeCloseImage;
+  } else if (isMouthOpen && mouthOpenImage) {
+    currentImage = mouthOpenImage;
+  }
+
+  const animationTransform = getAnimationTransform();
+
+  return (
+    <div
+      style={{
+        width: '100%',
+        height: '100%',
+        transform: animationTransform || undefined,
+      }}
+    >
+      <Img
+        src={staticFile(currentImage)}
+        style={{
+          width: '100%',
+          height: '100%',
+          objectFit: 'contain',
+        }}
+      />
+    </div>
+  );
+};
+
+// CharacterLayer places a character on screen. Its props only change when the
+// persona starts or stops speaking, so React.memo skips it on most frames and
+// only CharacterFace follows the current frame.
+const CharacterLayer = React.memo<{
+  characterImage?: string;
+  characterPosition?: 'left' | 'right' | 'center';
+  mouthOpenImage?: string;
+  eyeCloseImage?: string;
+  animationStyle?: 'bounce' | 'sway' | 'static';
+  isSpeaking?: boolean;
+  startFrame?: number;
+  endFrame?: number;
+  fps: number;
+}>(({
+  characterImage,
+  characterPosition = 'left',
+  mouthOpenImage,
+  eyeCloseImage,
+  animationStyle = 'sway',
+  isSpeaking = true,
+  fps,
+}) => {
+  if (!characterImage) {
+    return null;
+  }
+
+  // Position calculation
+  // Negative values push characters further outside to avoid slide overlap
+  const getPosition = () => {
+    const positions = {
+      left: { left: '-50px', bottom: '20px' },
+      right: { right: '-50px', bottom: '20px' },
+      center: { left: '50%', bottom: '20px', transform: 'translateX(-50%)' },
+    };
+    return positions[characterPosition];
+  };
+
+  const position = getPosition();
+
+  // Flip character horizontally if positioned on the left
+  // (characters face left by default, so flip them to face right)
+  const flipTransform = characterPosition === 'left' ? 'scaleX(-1)' : '';
+
+  // Combine position and flip transforms; the animation transform is applied
+  // by CharacterFace on the inner element, which composes in the same order
+  const baseTransform = position.transform || '';
+  const transforms = baseTransform && flipTransform
+    ? `${baseTransform} ${flipTransform}`
+    : baseTransform || flipTransform;
+
+  return (
+    <div
+      style={{
+        position: 'absolute',
+        ...position,
+        width: '300px',
+        height: '300px',
+        zIndex: 10,
+        transform: transforms || undefined,
+      }}
+    >
+      <CharacterFace
+        characterImage={characterImage}
+        mouthOpenImage={mouthOpenImage}
+        eyeCloseImage={eyeCloseImage}
+        animationStyle={animationStyle}
+        isSpeaking={isSpeaking}
+        fps={fps}
+      />
+    </div>
+  );
+});
+
+// interpolate options holding the output at the ends of the input range
+const CLAMP = { extrapolateLeft: 'clamp', extrapolateRight: 'clamp' } as const;
+
+const AudioSubtitleLayer: React.FC<{
+  audioFile: string;
+  subtitle?: string;
+  subtitleColor?: string;
+  fps: number;
+}> = ({ audioFile, subtitle, subtitleColor, fps }) => {
+  // Frame relative to the enclosing Sequence, i.e. to the start of this phrase
+  const frame = useCurrentFrame();
+
+  // Subtle fade for subtitles only
+  const fadeInDuration = fps * 0.3;
+  const opacity = interpolate(frame, [0, fadeInDuration], [0, 1], CLAMP);
+
+  // Stroke color from persona, default defined in constants.py
+  const strokeColor = subtitleColor || '__DEFAULT_SUBTITLE_COLOR__';
+
+  return (
+    <>
+      <Audio src={staticFile(audioFile)} />
+
+      {subtitle && (
+        <div
+          style={{
+            position: 'absolute',
+            bottom: '30px',
+            left: '50%',
+            transform: 'translateX(-50%)',
+            color: 'white',
+            fontSize: '36px',
+            fontFamily: '"Noto Sans JP", "Noto Sans CJK JP", "Yu Gothic", "Hiragino Sans", "Meiryo", Arial, sans-serif',
+            fontWeight: 'bold',
+            width: '80%',
+            textAlign: 'center',
+            lineHeight: '1.4',
+            opacity,
+            WebkitTextStroke: `1.5px ${strokeColor}`,
+            textShadow: '0 0 10px rgba(0, 0, 0, 0.8)',
+          }}
+        >
+          {subtitle}
+        </div>
+      )}
+    </>
+  );
+};
+
+// BgmAudio component
+// The fade is passed to Audio as a volume callback, so the component itself
+// has no frame dependency and React.memo skips it on every frame
+const BgmAudio = React.memo<{
+  path: string;
+  volume?: number;
+  fadeInSeconds?: number;
+  fadeOutSeconds?: number;
+  loop?: boolean;
+  fps: number;
+  durationInFrames: number;
+}>(({
+  path,
+  volume = 0.3,
+  fadeInSeconds = 2.0,
+  fadeOutSeconds = 2.0,
+  loop = true,
+  fps,
+  durationInFrames,
+}) => {
+  const getVolume = React.useCallback(
+    (frame: number) => {
+      // Calculate fade-in (interpolate needs a non-empty range, so a
+      // zero-length fade is skipped)
+      const fadeInFrames = fadeInSeconds * fps;
+      const fadeInProgress = fadeInFrames > 0
+        ? interpolate(frame, [0, fadeInFrames], [0, 1], CLAMP)
+        : 1;
+
+      // Calculate fade-out
+      const fadeOutFrames = fadeOutSeconds * fps;
+      const fadeOutStartFrame = durationInFrames - fadeOutFrames;
+      const fadeOutProgress = fadeOutFrames > 0
+        ? interpolate(frame, [fadeOutStartFrame, durationInFrames], [1, 0], CLAMP)
+        : 1;
+
+      // Combine fades
+      return volume * fadeInProgress * fadeOutProgress;
+    },
+    [volume, fadeInSeconds, fadeOutSeconds, fps, durationInFrames]
+  );
+
+  // loopVolumeCurveBehavior="extend" keeps counting frames across loop
+  // iterations, so the fade follows the whole video instead of restarting
+  return (
+    <Audio
+      src={staticFile(path)}
+      volume={getVolume}
+      loop={loop}
+      loopVolumeCurveBehavior="extend"
+    />
+  );
+});
+
+export const VideoGenerator: React.FC<VideoGeneratorProps> = ({ phrases }) => {
+  // Scene timing, slide groups and speaking intervals depend only on props,
+  // so they are computed once rather than on every rendered frame
+  const scenes = React.useMemo(() => getScenesWithTiming(phrases), [phrases]);
+  const { fps, durationInFrames } = useVideoConfig();
+  const frame = useCurrentFrame();
+
+  // Get transition configuration from composition data
+  const transitionType = (compositionData as any).transition?.type || 'fade';
+  const transitionDuration = (compositionData as any).transition?.duration_frames || 15;
+  const transitionTiming = (compositionData as any).transition?.timing || 'linear';
+
+  // Stable identities across frames, so TransitionSeries and the memoized
+  // slide children below see unchanged props
+  const presentation = React.useMemo(
+    () => getTransitionPresentation(transitionType),
+    [transitionType]
+  );
+  const timing = React.useMemo(
+    () => getTransitionTiming(transitionTiming, transitionDuration),
+    [transitionTiming, transitionDuration]
+  );
+
+  // Calculate actual transition duration for slide sequences
+  const transitionDurationFrames = React.useMemo(
+    () => timing.getDurationInFrames({ fps }),
+    [timing, fps]
+  );
+
+  // Build slide groups with transition compensation
+  // This ensures slides stay visible for the full duration of their audio
+  const slideGroups = React.useMemo(
+    () => getSlideGroups(scenes, transitionDurationFrames),
+    [scenes, transitionDurationFrames]
+  );
+
+  // Flat list of slide sequences with a transition between each pair, built
+  // once instead of wrapping every group in a Fragment on every frame
+  const slideChildren = React.useMemo(() => {
+    const children: React.ReactNode[] = [];
+    slideGroups.forEach((group, index) => {
+      children.push(
+        <TransitionSeries.Sequence key={`slide-${index}`} durationInFrames={group.durationFrames}>
+          <SlideLayer slideFile={group.slideFile} />
+        </TransitionSeries.Sequence>
+      );
+      // Add transition between slides, but not after the last slide
+      if (index < slideGroups.length - 1) {
+        children.push(
+          <TransitionSeries.Transition
+            key={`transition-${index}`}
+            presentation={presentation}
+            timing={timing}
+          />
+        );
+      }
+    });
+    return children;
+  }, [slideGroups, presentation, timing]);
+
+  const speakingIntervals = React.useMemo(() => getSpeakingIntervals(scenes), [scenes]);
+
+  // Get personas configuration
+  const personas = (compositionData as any).personas || [];
+
+  // Helper function to check if a persona is speaking at current frame
+  const isPersonaSpeaking = (personaId: string) => {
+    return isFrameInIntervals(speakingIntervals.get(personaId), frame);
+  };
+
+  // Get background and BGM configuration
+  const background = (compositionData as any).background;
+  const bgm = (compositionData as any).bgm;
+
+  return (
+    <AbsoluteFill style={{ backgroundColor: '#1a1a1a' }}>
+      {/* Background layer - lowest z-index */}
+      <BackgroundLayer
+        type={background?.type}
+        path={background?.path}
+        fit={background?.fit}
+        loopDurationInFrames={background?.loopDurationInFrames || durationInFrames}
+      />
+
+      {/* TransitionSeries for slides */}
+      <TransitionSeries>{slideChildren}</TransitionSeries>
+
+      {/* Character layers - persistent display for each persona */}
+      {personas.map((persona: any, index: number) => {
+        // Fallback position assignment if not configured
+        const positions = ['left', 'right', 'center'];
+        const fallbackPosition = positions[Math.min(index, positions.length - 1)];
+
+        return (
+          <CharacterLayer
+            key={`character-${persona.id}`}
+            characterImage={persona.character_image}
+            characterPosition={persona.character_position || fallbackPosition}
+            mouthOpenImage={persona.mouth_open_image}
+            eyeCloseImage={persona.eye_close_image}
+            animationStyle={persona.animation_style || 'sway'}
+            isSpeaking={isPersonaSpeaking(persona.id)}
+            fps={fps}
+          />
+        );
+      })}
+
+      {/* Audio and subtitle layer - changes with each phrase */}
+      {scenes.map((scene) => (
+        <Sequence
+          key={scene.id}
+          from={scene.startFrame}
+          durationInFrames={scene.durationFrames}
+        >
+          <AudioSubtitleLayer
+            audioFile={scene.audioFile}
+            subtitle={scene.subtitle}
+            subtitleColor={scene.subtitleColor}
+            fps={fps}
+          />
+        </Sequence>
+      ))}
+
+      {/* BGM audio - plays throughout the video */}
+      {bgm && (
+        <BgmAudio
+          path={bgm.path}
+          volume={bgm.volume}
+          fadeInSeconds={bgm.fade_in_seconds}
+          fadeOutSeconds={bgm.fade_out_seconds}
+          loop={bgm.loop}
+          fps={fps}
+          durationInFrames={durationInFrames}
+        />
+      )}
+    </AbsoluteFill>
+  );
+};
+
+// Calculate total frames for the composition
+// The total duration includes audio plus ending pause to keep final slide visible.
+export const calculateTotalFrames = (phrases: PhraseData[]): number => {
+  const fps = (compositionData as any).fps || 30;
+
+  // Return audio duration plus 1 second ending pause
+  // This keeps the final slide visible after audio ends.
+  if (phrases.length === 0) return 0;
+
+  // Only the last phrase's end frame matters, so derive it with the same
+  // rules as getScenesWithTiming without building a scene for every phrase
+  const lastPhrase = phrases[phrases.length - 1];
+  let lastStartFrame: number;
+  if (lastPhrase.start_time !== undefined) {
+    lastStartFrame = Math.round(lastPhrase.start_time * fps);
+  } else {
+    let elapsedSeconds = 0;
+    for (let i = 0; i < phrases.length - 1; i++) {
+      elapsedSeconds += phrases[i].duration;
+    }
+    lastStartFrame = Math.round(elapsedSeconds * fps);
+  }
+  const lastEndFrame = lastStartFrame + Math.round(lastPhrase.duration * fps);
+  const endingPauseFrames = fps; // 1.0 second
+  return lastEndFrame + endingPauseFrames;
+};
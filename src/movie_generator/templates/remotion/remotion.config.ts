@@ -0,0 +1,13 @@
+import { Config } from '@remotion/cli/config';
+
+Config.setVideoImageFormat('jpeg');
+Config.setOverwriteOutput(true);
+Config.setDelayRenderTimeoutInMilliseconds(120000); // 2 minutes timeout
+
+// Encoding settings for better compatibility and seeking
+Config.setCodec('h264');
+Config.setPixelFormat('yuv420p'); // Widely compatible pixel format
+Config.setCrf(23); // Quality setting: 23 is good balance (lower = higher quality, 18 = very high, 28 = medium)
+
+// Ensure fonts are available for rendering
+Config.setChromiumOpenGlRenderer('egl');
@@ -2,13 +2,16 @@
 
 from .filesystem import is_valid_file, skip_if_exists
 from .retry import retry_with_backoff
-from .subprocess import run_command_safely
+from .serialization import dumps_json_bytes
+from .subprocess import make_command_runner, run_command_safely
 from .text import clean_katakana_reading
 
 __all__ = [
     "is_valid_file",
     "skip_if_exists",
     "retry_with_backoff",
+    "dumps_json_bytes",
     "run_command_safely",
+    "make_command_runner",
     "clean_katakana_reading",
 ]
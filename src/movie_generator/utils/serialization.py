@@ -0,0 +1,27 @@
+"""JSON serialization utilities."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 encoded JSON.
+
+    Uses orjson when installed, otherwise falls back to the standard library
+    encoder with compact separators. Output is not indented: files written
+    with this helper are consumed by tooling (e.g., Remotion), not humans.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,20 +1,93 @@
 """Subprocess execution utilities."""
 
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, Literal, overload
 
 
+def _decode_output(output: str | bytes | None) -> str:
+    """Decode captured process output for error messages.
+
+    Args:
+        output: Captured stdout/stderr (bytes, str, or None).
+
+    Returns:
+        Decoded text, or an empty string if nothing was captured.
+    """
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output or ""
+
+
+def _run_command(
+    command: list[str],
+    cwd: Path | None,
+    check: bool,
+    capture_output: bool,
+    text: bool,
+    error_message: str | None,
+) -> subprocess.CompletedProcess[Any]:
+    """Run a command, translating launch and exit failures into RuntimeError.
+
+    Shared implementation of run_command_safely and make_command_runner.
+    """
+    try:
+        return subprocess.run(
+            command,
+            cwd=cwd,
+            check=check,
+            capture_output=capture_output,
+            text=text,
+        )
+    except FileNotFoundError as e:
+        cmd_name = command[0] if command else "command"
+        msg = error_message or f"{cmd_name} is not installed or not available in PATH"
+        raise RuntimeError(msg) from e
+    except subprocess.CalledProcessError as e:
+        if error_message:
+            raise RuntimeError(f"{error_message}\n{_decode_output(e.stderr)}") from e
+        raise
+
+
+@overload
+def run_command_safely(
+    command: list[str],
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    text: Literal[False] = False,
+    error_message: str | None = None,
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+@overload
 def run_command_safely(
     command: list[str],
     *,
     cwd: Path | None = None,
     check: bool = True,
     capture_output: bool = True,
-    text: bool = True,
+    text: Literal[True],
     error_message: str | None = None,
-) -> subprocess.CompletedProcess[str]:
+) -> subprocess.CompletedProcess[str]: ...
+
+
+def run_command_safely(
+    command: list[str],
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    text: bool = False,
+    error_message: str | None = None,
+) -> subprocess.CompletedProcess[Any]:
     """Run a command with consistent error handling.
 
+    Output is captured as bytes by default; most callers only inspect it on
+    failure, where stderr is decoded on demand for the error message.
+
     Args:
         command: Command and arguments as list.
         cwd: Working directory for command execution.
@@ -30,20 +103,57 @@ def run_command_safely(
         RuntimeError: If command not found or execution fails with custom message.
         subprocess.CalledProcessError: If check=True and command fails.
     """
-    try:
-        return subprocess.run(
-            command,
-            cwd=cwd,
-            check=check,
-            capture_output=capture_output,
-            text=text,
-        )
-    except FileNotFoundError as e:
-        cmd_name = command[0] if command else "command"
-        msg = error_message or f"{cmd_name} is not installed or not available in PATH"
-        raise RuntimeError(msg) from e
-    except subprocess.CalledProcessError as e:
-        if error_message:
-            # Re-raise with custom message in exception chain
-            raise RuntimeError(f"{error_message}\n{e.stderr if e.stderr else ''}") from e
-        raise
+    return _run_command(command, cwd, check, capture_output, text, error_message)
+
+
+@overload
+def make_command_runner(
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    text: Literal[False] = False,
+    error_message: str | None = None,
+) -> Callable[[list[str]], subprocess.CompletedProcess[bytes]]: ...
+
+
+@overload
+def make_command_runner(
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    text: Literal[True],
+    error_message: str | None = None,
+) -> Callable[[list[str]], subprocess.CompletedProcess[str]]: ...
+
+
+def make_command_runner(
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    text: bool = False,
+    error_message: str | None = None,
+) -> Callable[[list[str]], subprocess.CompletedProcess[Any]]:
+    """Create a runner with options bound once, for repeated invocations.
+
+    The returned callable behaves like run_command_safely with the given
+    options, but the options are fixed up front instead of being passed on
+    every call (e.g., in batch rendering loops).
+
+    Args:
+        cwd: Working directory for command execution.
+        check: Whether to raise CalledProcessError on non-zero exit.
+        capture_output: Whether to capture stdout/stderr.
+        text: Whether to decode output as text.
+        error_message: Custom error message prefix on failure.
+
+    Returns:
+        Function taking a command list and returning a CompletedProcess.
+    """
+
+    def run(command: list[str]) -> subprocess.CompletedProcess[Any]:
+        return _run_command(command, cwd, check, capture_output, text, error_message)
+
+    return run
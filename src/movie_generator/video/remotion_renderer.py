@@ -4,8 +4,20 @@ Generates video using Remotion's render functionality with subtitle animations.
 Per-project Remotion setup with pnpm workspace integration.
 """
 
+import asyncio
+import filecmp
+import functools
 import json
+import os
+import shutil
+import stat
 import subprocess
+import tempfile
+import threading
+import wave
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,21 +26,72 @@ from rich.console import Console
 from ..constants import ProjectPaths, SubtitleConstants, TimeoutConstants, VideoConstants
 from ..exceptions import RenderingError
 from ..script.phrases import Phrase
-from .renderer import CompositionConfig, CompositionPhrase, RenderConfig
+from ..utils.serialization import dumps_json_bytes
+from .renderer import SLIDE_FILENAME_RE, CompositionConfig, RenderConfig, concat_list_line
 
 console = Console()
 
+# Remotion roots whose rendering environment has been verified in this process.
+# Batch/worker runs render many videos against the same root, so the checks
+# (pnpm install probe, browser link, assets symlink) only need to run once.
+_READY_REMOTION_ROOTS: set[Path] = set()
 
-def _get_video_duration_frames(video_path: Path, fps: int = 30) -> int | None:
-    """Get video duration in frames using ffprobe.
+# Remotion roots with pnpm dependencies confirmed installed in this process
+_DEPS_READY_ROOTS: set[Path] = set()
+# One lock per root, so an install in one project never blocks renders in
+# another; _DEPS_LOCKS_GUARD only protects the dict itself
+_DEPS_LOCKS: dict[Path, threading.Lock] = {}
+_DEPS_LOCKS_GUARD = threading.Lock()
+
+# Marker written inside node_modules after dependencies are confirmed. It records
+# the manifest/lockfile mtimes, so it goes stale when they change and disappears
+# together with node_modules.
+DEPS_MARKER_FILENAME = ".movie_generator_deps_ok"
+_DEPS_MANIFEST_FILENAMES = ("package.json", "pnpm-lock.yaml")
+
+# Language subdirectories slides may be rendered into (slides/<lang>/slide_0000.png)
+_SLIDE_LANGUAGE_DIRS = frozenset({"ja", "en", "zh"})
+
+# Trailing lines of Remotion output kept for error reporting
+RENDER_OUTPUT_TAIL_LINES = 200
+
+# Suffix of the marker placed next to a BGM copy remuxed by ffmpeg (album art
+# stripped), letting later renders recognize it as up to date despite the size
+# difference
+STRIPPED_MARKER_SUFFIX = ".stripped"
+
+# AAC bitrate used when muxing the audio track of a chunked render (Remotion's
+# own default for h264 output)
+CHUNKED_AUDIO_BITRATE = "320k"
+
+# Chunk size for reading Remotion's output pipe; progress lines are tiny and
+# frequent, so larger reads drain them with far fewer calls. Also bounds how
+# much of an over-long line is kept.
+RENDER_OUTPUT_BUFFER_SIZE = 64 * 1024
+
+
+def _probe_duration_seconds(file_path: Path) -> float | None:
+    """Get the container duration of a media file using ffprobe.
+
+    Results are memoized per file content identity (path, size, mtime), so
+    batch runs reusing the same background video probe it only once.
 
     Args:
-        video_path: Path to the video file.
-        fps: Frames per second (default: 30).
+        file_path: Path to the media file.
 
     Returns:
-        Duration in frames, or None if unable to determine.
+        Duration in seconds, or None if unable to determine.
     """
+    try:
+        file_stat = file_path.stat()
+    except OSError:
+        return None
+    return _probe_duration_seconds_cached(file_path, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_duration_seconds_cached(file_path: Path, size: int, mtime_ns: int) -> float | None:
+    """Run ffprobe for a file; size and mtime_ns only key the cache."""
     try:
         result = subprocess.run(
             [
@@ -39,18 +102,33 @@ def _get_video_duration_frames(video_path: Path, fps: int = 30) -> int | None:
                 "format=duration",
                 "-of",
                 "default=noprint_wrappers=1:nokey=1",
-                str(video_path),
+                str(file_path),
             ],
             capture_output=True,
             text=True,
             check=True,
         )
-        duration_seconds = float(result.stdout.strip())
-        return int(duration_seconds * fps)
+        return float(result.stdout.strip())
     except (subprocess.CalledProcessError, ValueError, FileNotFoundError):
         return None
 
 
+def _get_video_duration_frames(video_path: Path, fps: int = 30) -> int | None:
+    """Get video duration in frames using ffprobe.
+
+    Args:
+        video_path: Path to the video file.
+        fps: Frames per second (default: 30).
+
+    Returns:
+        Duration in frames, or None if unable to determine.
+    """
+    duration_seconds = _probe_duration_seconds(video_path)
+    if duration_seconds is None:
+        return None
+    return int(duration_seconds * fps)
+
+
 def create_remotion_input(
     phrases: list[Phrase],
     audio_paths: list[Path],
@@ -66,51 +144,65 @@ def create_remotion_input(
     Returns:
         List of phrase dictionaries for Remotion.
     """
-    composition_phrases = []
-
-    for i, phrase in enumerate(phrases):
-        audio_file = str(audio_paths[i]) if i < len(audio_paths) else ""
-        slide_file = str(slide_paths[i]) if slide_paths and i < len(slide_paths) else None
-
-        composition_phrases.append(
-            CompositionPhrase(
-                text=phrase.text,
-                duration=phrase.duration,
-                start_time=phrase.start_time,
-                audioFile=audio_file,
-                slideFile=slide_file,
-            )
-        )
+    num_audio = len(audio_paths)
+
+    # Same keys as CompositionPhrase.model_dump(exclude_none=True)
+    composition_phrases: list[dict[str, Any]] = [
+        {
+            "text": phrase.text,
+            "duration": phrase.duration,
+            "start_time": phrase.start_time,
+            "audioFile": os.fspath(audio_paths[i]) if i < num_audio else "",
+        }
+        for i, phrase in enumerate(phrases)
+    ]
+    # slideFile is only present for phrases that have a slide (zip stops at the shorter)
+    for entry, slide_path in zip(composition_phrases, slide_paths or (), strict=False):
+        entry["slideFile"] = os.fspath(slide_path)
 
-    return [p.model_dump(exclude_none=True) for p in composition_phrases]
+    return composition_phrases
 
 
 def _build_slide_map(slide_paths: list[Path]) -> dict[int, str]:
     """Build a map from section_index to slide file path.
 
+    Results are memoized per slide path list, so retries and repeated
+    lookups don't re-parse every filename.
+
     Args:
         slide_paths: List of slide paths.
 
+    Returns:
+        Dictionary mapping section_index to slide path string.
+    """
+    return dict(_build_slide_map_cached(tuple(slide_paths)))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_slide_map_cached(slide_paths: tuple[Path, ...]) -> dict[int, str]:
+    """Build the slide map for a hashable tuple of slide paths.
+
+    Callers must not mutate the returned (shared) dictionary.
+
+    Args:
+        slide_paths: Tuple of slide paths.
+
     Returns:
         Dictionary mapping section_index to slide path string.
     """
     slide_map: dict[int, str] = {}
     for slide_path in slide_paths:
         filename = slide_path.name
-        # Extract section index from filename using format from ProjectPaths
-        prefix = ProjectPaths.SLIDE_FILENAME_FORMAT.split("{")[0]  # "slide_"
-        suffix = ".png"
-        if filename.startswith(prefix) and filename.endswith(suffix):
-            try:
-                section_index = int(filename[6:10])
-                # Determine if it's in a language subdirectory
-                if slide_path.parent.name in ["ja", "en", "zh"]:
-                    lang = slide_path.parent.name
-                    slide_map[section_index] = f"slides/{lang}/{filename}"
-                else:
-                    slide_map[section_index] = f"slides/{filename}"
-            except ValueError:
-                pass
+        # Extract section index from filename (e.g., "slide_0003.png" -> 3)
+        match = SLIDE_FILENAME_RE.fullmatch(filename)
+        if match:
+            section_index = int(match.group(1))
+            # Determine if it's in a language subdirectory
+            lang = slide_path.parent.name
+            if lang in _SLIDE_LANGUAGE_DIRS:
+                slide_map[section_index] = f"slides/{lang}/{filename}"
+            else:
+                slide_map[section_index] = f"slides/{filename}"
     return slide_map
 
 
@@ -129,38 +221,99 @@ def _get_slide_file_path(slide_paths: list[Path], section_index: int) -> str:
     if not slide_paths:
         return ""
 
-    # Build slide map and look up by section_index
-    slide_map = _build_slide_map(slide_paths)
-    return slide_map.get(section_index, "")
+    # Look up in the memoized slide map directly; only reading it, no copy needed
+    return _build_slide_map_cached(tuple(slide_paths)).get(section_index, "")
+
+
+def _dependency_signature(remotion_root: Path) -> str:
+    """Build the marker content identifying the current dependency manifests.
+
+    Args:
+        remotion_root: Path to Remotion project root directory.
+
+    Returns:
+        JSON string mapping manifest filenames to their mtimes (0 if missing).
+    """
+    mtimes: dict[str, int] = {}
+    for filename in _DEPS_MANIFEST_FILENAMES:
+        try:
+            mtimes[filename] = (remotion_root / filename).stat().st_mtime_ns
+        except FileNotFoundError:
+            mtimes[filename] = 0
+    return json.dumps(mtimes, sort_keys=True)
+
+
+def _write_deps_marker(marker: Path, signature: str) -> None:
+    """Record confirmed dependencies; failures only cost a re-check next run."""
+    try:
+        marker.write_text(signature, encoding="utf-8")
+    except OSError:
+        pass
 
 
 def ensure_pnpm_dependencies(remotion_root: Path) -> None:
     """Ensure pnpm dependencies are installed in the Remotion project.
 
+    Roots confirmed in this process are remembered, skipping the
+    node_modules probe on later calls. A per-root lock serializes the
+    check so concurrent renders never run pnpm install in the same root
+    twice, while other roots proceed independently.
+
+    Across processes, a marker file in node_modules records the
+    package.json/pnpm-lock.yaml mtimes the install was confirmed for;
+    a stale marker (manifests changed since) triggers a reinstall.
+
     Args:
         remotion_root: Path to Remotion project root directory.
 
     Raises:
         RuntimeError: If pnpm install fails.
     """
-    node_modules = remotion_root / "node_modules"
-    if node_modules.exists():
-        return
+    with _DEPS_LOCKS_GUARD:
+        root_lock = _DEPS_LOCKS.setdefault(remotion_root, threading.Lock())
+    with root_lock:
+        if remotion_root in _DEPS_READY_ROOTS:
+            return
+
+        node_modules = remotion_root / "node_modules"
+        marker = node_modules / DEPS_MARKER_FILENAME
+        signature = _dependency_signature(remotion_root)
+        try:
+            recorded: str | None = marker.read_text(encoding="utf-8")
+        except OSError:
+            recorded = None
 
-    console.print("[cyan]Installing Remotion dependencies with pnpm...[/cyan]")
-    try:
-        subprocess.run(
-            ["pnpm", "install"],
-            cwd=remotion_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        console.print("[green]✓ Dependencies installed[/green]")
-    except subprocess.CalledProcessError as e:
-        console.print("[red]Failed to install dependencies:[/red]")
-        console.print(f"[red]{e.stderr}[/red]")
-        raise RenderingError("pnpm install failed") from e
+        if recorded == signature:
+            _DEPS_READY_ROOTS.add(remotion_root)
+            return
+
+        if recorded is None and node_modules.exists():
+            # Installed before markers were written (or by hand): trust it once
+            _write_deps_marker(marker, signature)
+            _DEPS_READY_ROOTS.add(remotion_root)
+            return
+
+        console.print("[cyan]Installing Remotion dependencies with pnpm...[/cyan]")
+        try:
+            # --prefer-offline reuses packages already in the pnpm store instead of
+            # revalidating them against the registry
+            subprocess.run(
+                ["pnpm", "install", "--prefer-offline"],
+                cwd=remotion_root,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            console.print("[green]✓ Dependencies installed[/green]")
+        except subprocess.CalledProcessError as e:
+            console.print("[red]Failed to install dependencies:[/red]")
+            console.print(f"[red]{e.stderr}[/red]")
+            raise RenderingError("pnpm install failed") from e
+
+        # pnpm install may create or rewrite pnpm-lock.yaml, so record the
+        # manifests as they are after the install
+        _write_deps_marker(marker, _dependency_signature(remotion_root))
+        _DEPS_READY_ROOTS.add(remotion_root)
 
 
 def ensure_rendering_environment(remotion_root: Path) -> None:
@@ -171,12 +324,18 @@ def ensure_rendering_environment(remotion_root: Path) -> None:
     - Chrome Headless Shell download/linking
     - Asset symlink creation (for Docker environments)
 
+    Results are cached per remotion_root for the lifetime of the process,
+    so repeated renders against the same project skip the checks.
+
     Args:
         remotion_root: Path to Remotion project root directory.
 
     Raises:
         RuntimeError: If environment setup fails.
     """
+    if remotion_root in _READY_REMOTION_ROOTS:
+        return
+
     # 1. Ensure pnpm dependencies are installed
     ensure_pnpm_dependencies(remotion_root)
 
@@ -188,14 +347,19 @@ def ensure_rendering_environment(remotion_root: Path) -> None:
     # but assets are in project root ({project_root}/assets)
     job_dir = remotion_root.parent
     assets_symlink = job_dir / "assets"
-    if not assets_symlink.exists():
-        import os
-
+    # lexists: a dangling symlink still occupies the name and must not be recreated
+    if not os.path.lexists(assets_symlink):
         project_root = ProjectPaths.get_docker_project_root()
         assets_dir = project_root / "assets"
         if assets_dir.exists():
-            os.symlink(assets_dir, assets_symlink)
-            console.print(f"[green]Created symlink: {assets_symlink} -> {assets_dir}[/green]")
+            try:
+                os.symlink(assets_dir, assets_symlink)
+                console.print(f"[green]Created symlink: {assets_symlink} -> {assets_dir}[/green]")
+            except FileExistsError:
+                # Another worker sharing this job directory created it first
+                pass
+
+    _READY_REMOTION_ROOTS.add(remotion_root)
 
 
 def ensure_chrome_headless_shell(remotion_root: Path) -> None:
@@ -219,9 +383,16 @@ def ensure_chrome_headless_shell(remotion_root: Path) -> None:
     local_remotion_dir = remotion_root / "node_modules" / ".remotion"
     local_browser_path = local_remotion_dir / "chrome-headless-shell"
 
-    # If local path already exists (file or symlink), we're done
-    if local_browser_path.exists() or local_browser_path.is_symlink():
-        return
+    # If local path already exists (copied browser or live symlink), we're done.
+    # A symlink left dangling by an evicted global cache is removed and recreated.
+    try:
+        local_stat = os.lstat(local_browser_path)
+    except FileNotFoundError:
+        local_stat = None
+    if local_stat is not None:
+        if not stat.S_ISLNK(local_stat.st_mode) or local_browser_path.exists():
+            return
+        local_browser_path.unlink()
 
     # Ensure local .remotion directory exists
     local_remotion_dir.mkdir(parents=True, exist_ok=True)
@@ -230,34 +401,52 @@ def ensure_chrome_headless_shell(remotion_root: Path) -> None:
     if not global_cache.exists():
         console.print("[cyan]Downloading Chrome Headless Shell (shared cache)...[/cyan]")
 
-        # Create a temporary project to download the browser
-        temp_download_dir = project_root / ".cache" / "remotion" / "_temp_download"
-        temp_download_dir.mkdir(parents=True, exist_ok=True)
+        # Prefer the Remotion CLI this project already installed: it downloads the
+        # browser into remotion_root/node_modules/.remotion without a throwaway
+        # pnpm install. Otherwise fall back to a temporary project.
+        local_cli = remotion_root / "node_modules" / ".bin" / "remotion"
+        temp_download_dir: Path | None = None
+        if local_cli.exists():
+            download_dir = remotion_root
+            remotion_bin = local_cli
+        else:
+            temp_download_dir = project_root / ".cache" / "remotion" / "_temp_download"
+            temp_download_dir.mkdir(parents=True, exist_ok=True)
+            download_dir = temp_download_dir
+            # Use direct path to remotion binary instead of npx
+            # npx does not work reliably in pnpm environments
+            remotion_bin = temp_download_dir / "node_modules" / ".bin" / "remotion"
 
         try:
-            # Create minimal package.json for download
-            temp_package_json = temp_download_dir / "package.json"
-            temp_package_json.write_text('{"dependencies": {"@remotion/cli": "^4.0.0"}}')
-
-            # Install remotion CLI in temp directory
-            # NOTE: --ignore-workspace is required because the project may have
-            # pnpm-workspace.yaml, and pnpm would otherwise refuse to install
-            # dependencies outside the workspace-defined packages
-            subprocess.run(
-                ["pnpm", "install", "--no-frozen-lockfile", "--ignore-workspace"],
-                cwd=temp_download_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            if temp_download_dir is not None:
+                # Create minimal package.json for download
+                temp_package_json = temp_download_dir / "package.json"
+                temp_package_json.write_text('{"dependencies": {"@remotion/cli": "^4.0.0"}}')
+
+                # Install remotion CLI in temp directory
+                # NOTE: --ignore-workspace is required because the project may have
+                # pnpm-workspace.yaml, and pnpm would otherwise refuse to install
+                # dependencies outside the workspace-defined packages.
+                # --prefer-offline resolves @remotion/cli from pnpm's shared store
+                # when an earlier project install already fetched it
+                subprocess.run(
+                    [
+                        "pnpm",
+                        "install",
+                        "--no-frozen-lockfile",
+                        "--ignore-workspace",
+                        "--prefer-offline",
+                    ],
+                    cwd=temp_download_dir,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
 
             # Download browser
-            # Use direct path to remotion binary instead of npx
-            # npx does not work reliably in pnpm environments
-            remotion_bin = temp_download_dir / "node_modules" / ".bin" / "remotion"
             subprocess.run(
                 [str(remotion_bin), "browser", "ensure"],
-                cwd=temp_download_dir,
+                cwd=download_dir,
                 check=True,
                 capture_output=True,
                 text=True,
@@ -265,14 +454,12 @@ def ensure_chrome_headless_shell(remotion_root: Path) -> None:
             )
 
             # Move downloaded browser to global cache
-            temp_browser = (
-                temp_download_dir / "node_modules" / ".remotion" / "chrome-headless-shell"
+            downloaded_browser = (
+                download_dir / "node_modules" / ".remotion" / "chrome-headless-shell"
             )
-            if temp_browser.exists():
+            if downloaded_browser.exists():
                 global_cache.parent.mkdir(parents=True, exist_ok=True)
-                import shutil
-
-                shutil.move(str(temp_browser), str(global_cache))
+                shutil.move(str(downloaded_browser), str(global_cache))
                 console.print("[green]✓ Chrome Headless Shell downloaded to shared cache[/green]")
             else:
                 raise RenderingError("Browser download succeeded but files not found")
@@ -286,136 +473,188 @@ def ensure_chrome_headless_shell(remotion_root: Path) -> None:
             raise RenderingError("Chrome Headless Shell download failed") from e
         finally:
             # Clean up temp directory
-            import shutil
-
-            if temp_download_dir.exists():
+            if temp_download_dir is not None and temp_download_dir.exists():
                 shutil.rmtree(temp_download_dir, ignore_errors=True)
 
     # Create symlink from local path to global cache
     try:
         local_browser_path.symlink_to(global_cache, target_is_directory=True)
         console.print("[green]✓ Chrome Headless Shell linked from shared cache[/green]")
+    except FileExistsError:
+        # A concurrent render of the same project linked it first
+        pass
     except OSError as e:
         console.print(f"[yellow]Warning: Failed to create symlink: {e}[/yellow]")
         console.print("[yellow]Falling back to copying browser files...[/yellow]")
-        import shutil
+        shutil.copytree(global_cache, local_browser_path, copy_function=_fast_copy)
 
-        shutil.copytree(global_cache, local_browser_path)
 
+def _build_persona_position_map(personas: list[dict[str, Any]] | None) -> dict[str, str]:
+    """Assign default character positions based on persona order.
 
-def build_composition_data(
+    Args:
+        personas: Optional list of persona configurations.
+
+    Returns:
+        Map of persona ID to position: first -> left, second -> right, third+ -> center.
+    """
+    positions = ["left", "right", "center"]
+    return {
+        persona["id"]: positions[min(i, len(positions) - 1)]
+        for i, persona in enumerate(personas or [])
+    }
+
+
+def _iter_composition_phrases(
     config: CompositionConfig,
     remotion_root: Path,
-) -> dict[str, Any]:
-    """Build composition data dictionary from configuration.
-
-    This function centralizes the logic for generating composition.json data,
-    including default handling and backward compatibility for speaker information.
+    persona_position_map: dict[str, str],
+) -> Iterator[dict[str, Any]]:
+    """Yield composition.json phrase entries one at a time.
 
     Args:
         config: Configuration object with all composition inputs.
         remotion_root: Path to Remotion project root (needed for asset path conversion).
+        persona_position_map: Map of persona ID to auto-assigned position.
 
-    Returns:
-        Dictionary containing composition data ready for JSON serialization.
+    Yields:
+        Phrase dictionaries with camelCase keys, None values omitted.
     """
     # Build slide map for efficient lookup
     slide_map = _build_slide_map(config.slide_paths) if config.slide_paths else {}
 
-    # Build persona lookup map and position assignment map
-    persona_map: dict[str, dict[str, Any]] = {}
-    persona_position_map: dict[str, str] = {}
-    if config.personas:
-        # Assign positions based on persona order
-        positions = ["left", "right", "center"]
-        for i, persona in enumerate(config.personas):
-            persona_id = persona["id"]
-            persona_map[persona_id] = persona
-            # Assign position: first persona -> left, second -> right, third+ -> center
-            persona_position_map[persona_id] = positions[min(i, len(positions) - 1)]
-
-    # Create CompositionPhrase objects
-    composition_phrases = []
+    # Build persona lookup map
+    persona_map: dict[str, dict[str, Any]] = {p["id"]: p for p in config.personas or []}
+
+    # Public-relative audio paths, formatted once rather than per phrase
+    audio_files = [f"audio/{audio_path.name}" for audio_path in config.audio_paths]
+
+    # Persona fields depend only on the phrase's persona, so compute them once per
+    # distinct (persona_id, persona_name) instead of once per phrase
+    persona_fields_cache: dict[tuple[str, str], dict[str, Any]] = {}
+    section_bg_cache: dict[int, dict[str, Any]] = {}
+
     for phrase in config.phrases:
-        persona_fields = _get_persona_fields(phrase, persona_map, persona_position_map)
-        # Get background override for this section
-        bg_override = None
-        if config.section_backgrounds and phrase.section_index in config.section_backgrounds:
+        persona_key = (phrase.persona_id, phrase.persona_name)
+        persona_fields = persona_fields_cache.get(persona_key)
+        if persona_fields is None:
+            persona_fields = {
+                key: value
+                for key, value in _get_persona_fields(
+                    phrase, persona_map, persona_position_map
+                ).items()
+                if value is not None
+            }
+            persona_fields_cache[persona_key] = persona_fields
+        # Get background override for this section (copied once per section;
+        # phrases of the same section share the converted entry)
+        bg_override = section_bg_cache.get(phrase.section_index)
+        if (
+            bg_override is None
+            and config.section_backgrounds
+            and phrase.section_index in config.section_backgrounds
+        ):
             bg_dict = config.section_backgrounds[phrase.section_index].copy()
             # Convert background path to public-relative
             bg_dict["path"] = _copy_asset_to_public(
                 Path(bg_dict["path"]), remotion_root, "backgrounds"
             )
-            bg_override = bg_dict
+            bg_override = section_bg_cache[phrase.section_index] = bg_dict
 
         # Determine audio file path:
         # Use audio_paths if available and index is in range, else fallback to default format
-        if config.audio_paths and phrase.original_index < len(config.audio_paths):
-            audio_path = config.audio_paths[phrase.original_index]
-            audio_file = f"audio/{audio_path.name}"
+        if 0 <= phrase.original_index < len(audio_files):
+            audio_file = audio_files[phrase.original_index]
         else:
             # Fallback to default format
             audio_file = (
                 f"audio/{ProjectPaths.PHRASE_FILENAME_FORMAT.format(index=phrase.original_index)}"
             )
 
-        composition_phrases.append(
-            CompositionPhrase(
-                text=phrase.get_subtitle_text(),
-                duration=phrase.duration,
-                start_time=phrase.start_time,
-                audioFile=audio_file,
-                slideFile=slide_map.get(phrase.section_index),
-                persona_id=persona_fields.get("personaId"),
-                persona_name=persona_fields.get("personaName"),
-                subtitle_color=persona_fields.get("subtitleColor"),
-                character_image=persona_fields.get("characterImage"),
-                character_position=persona_fields.get("characterPosition"),
-                mouth_open_image=persona_fields.get("mouthOpenImage"),
-                eye_close_image=persona_fields.get("eyeCloseImage"),
-                animation_style=persona_fields.get("animationStyle"),
-                background_override=bg_override,
-            )
-        )
+        # Build the entry directly with the camelCase keys of CompositionPhrase
+        # (serialized with by_alias=True, exclude_none=True), in the same key order,
+        # without instantiating and dumping a model per phrase
+        entry: dict[str, Any] = {
+            "text": phrase.get_subtitle_text(),
+            "duration": phrase.duration,
+            "start_time": phrase.start_time,
+            "audioFile": audio_file,
+        }
+        slide_file = slide_map.get(phrase.section_index)
+        if slide_file is not None:
+            entry["slideFile"] = slide_file
+        entry.update(persona_fields)
+        if bg_override is not None:
+            entry["backgroundOverride"] = bg_override
+        yield entry
+
 
-    composition_data = {
+def _build_composition_settings(
+    config: CompositionConfig,
+    remotion_root: Path,
+    persona_position_map: dict[str, str],
+) -> dict[str, Any]:
+    """Build every composition.json field except the phrase list.
+
+    Args:
+        config: Configuration object with all composition inputs.
+        remotion_root: Path to Remotion project root (needed for asset path conversion).
+        persona_position_map: Map of persona ID to auto-assigned position.
+
+    Returns:
+        Dictionary with title, dimensions, and optional transition/background/BGM/personas.
+    """
+    composition_data: dict[str, Any] = {
         "title": config.project_name,
         "fps": config.fps,
         "width": config.resolution[0],
         "height": config.resolution[1],
-        "phrases": [p.model_dump(exclude_none=True, by_alias=True) for p in composition_phrases],
     }
 
     # Add transition config if provided
     if config.transition:
         composition_data["transition"] = config.transition
 
-    # Add background config if provided (convert path to public-relative)
-    if config.background:
-        bg_config = config.background.copy()
-        original_path = Path(config.background["path"])
-        bg_config["path"] = _copy_asset_to_public(original_path, remotion_root, "backgrounds")
-
-        # For video backgrounds, get the video duration for proper looping
-        if config.background.get("type") == "video":
-            loop_frames = _get_video_duration_frames(original_path)
-            if loop_frames:
-                bg_config["loopDurationInFrames"] = loop_frames
-
-        composition_data["background"] = bg_config
+    # BGM goes through an ffmpeg remux and video backgrounds through ffprobe;
+    # when both are present, run the BGM copy in a worker thread so the two
+    # subprocesses overlap instead of running back to back
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        bgm_future = (
+            executor.submit(_copy_asset_to_public, Path(config.bgm["path"]), remotion_root, "bgm")
+            if config.bgm and config.background
+            else None
+        )
 
-    # Add BGM config if provided (convert path to public-relative)
-    if config.bgm:
-        bgm_config = config.bgm.copy()
-        bgm_config["path"] = _copy_asset_to_public(Path(config.bgm["path"]), remotion_root, "bgm")
-        composition_data["bgm"] = bgm_config
+        # Add background config if provided (convert path to public-relative)
+        if config.background:
+            bg_config = config.background.copy()
+            original_path = Path(config.background["path"])
+            bg_config["path"] = _copy_asset_to_public(original_path, remotion_root, "backgrounds")
+
+            # For video backgrounds, get the video duration for proper looping
+            if config.background.get("type") == "video":
+                loop_frames = _get_video_duration_frames(original_path)
+                if loop_frames:
+                    bg_config["loopDurationInFrames"] = loop_frames
+
+            composition_data["background"] = bg_config
+
+        # Add BGM config if provided (convert path to public-relative)
+        if config.bgm:
+            bgm_config = config.bgm.copy()
+            bgm_config["path"] = (
+                bgm_future.result()
+                if bgm_future is not None
+                else _copy_asset_to_public(Path(config.bgm["path"]), remotion_root, "bgm")
+            )
+            composition_data["bgm"] = bgm_config
 
     # Add personas config if provided (for persistent character display)
     if config.personas:
         # Convert asset paths in personas to be relative to public/
         # Auto-assign character_position only if not configured
         converted_personas = []
-        for i, persona in enumerate(config.personas):
+        for persona in config.personas:
             persona_copy = persona.copy()
 
             # CRITICAL: Always ensure character_position is set
@@ -424,14 +663,7 @@ def build_composition_data(
                 "character_position" not in persona_copy
                 or persona_copy["character_position"] is None
             ):
-                # Auto-assign position based on persona order
-                persona_id = persona["id"]
-                if persona_id in persona_position_map:
-                    persona_copy["character_position"] = persona_position_map[persona_id]
-                else:
-                    # Fallback: assign based on index
-                    positions = ["left", "right", "center"]
-                    persona_copy["character_position"] = positions[min(i, len(positions) - 1)]
+                persona_copy["character_position"] = persona_position_map[persona["id"]]
 
             if "character_image" in persona_copy and persona_copy["character_image"] is not None:
                 persona_copy["character_image"] = _convert_to_public_path(
@@ -451,6 +683,71 @@ def build_composition_data(
     return composition_data
 
 
+def build_composition_data(
+    config: CompositionConfig,
+    remotion_root: Path,
+) -> dict[str, Any]:
+    """Build composition data dictionary from configuration.
+
+    This function centralizes the logic for generating composition.json data,
+    including default handling and backward compatibility for speaker information.
+
+    Args:
+        config: Configuration object with all composition inputs.
+        remotion_root: Path to Remotion project root (needed for asset path conversion).
+
+    Returns:
+        Dictionary containing composition data ready for JSON serialization.
+    """
+    persona_position_map = _build_persona_position_map(config.personas)
+    composition_data = _build_composition_settings(config, remotion_root, persona_position_map)
+    composition_data["phrases"] = list(
+        _iter_composition_phrases(config, remotion_root, persona_position_map)
+    )
+    return composition_data
+
+
+def _write_composition_json(
+    composition_path: Path,
+    settings: dict[str, Any],
+    phrases: Iterable[dict[str, Any]],
+) -> bool:
+    """Write composition.json, serializing phrases one at a time.
+
+    The phrase list is never materialized: each entry is encoded and written
+    as it is produced, keeping peak memory flat for long videos. Output goes
+    to a temporary sibling file that only replaces composition.json when
+    its content differs, so unchanged re-renders leave the file (and its
+    mtime) untouched.
+
+    Args:
+        composition_path: Destination composition.json path.
+        settings: Non-phrase composition fields (must be non-empty).
+        phrases: Iterable of phrase dictionaries.
+
+    Returns:
+        True if composition.json was written, False if it was already up to date.
+    """
+    temp_path = composition_path.with_name(f".{composition_path.name}.tmp")
+    try:
+        with temp_path.open("wb") as f:
+            # Reopen the settings object to append the phrases array as its last member
+            f.write(dumps_json_bytes(settings)[:-1])
+            f.write(b',"phrases":[')
+            for i, phrase in enumerate(phrases):
+                if i:
+                    f.write(b",")
+                f.write(dumps_json_bytes(phrase))
+            f.write(b"]}")
+
+        if composition_path.exists() and filecmp.cmp(temp_path, composition_path, shallow=False):
+            return False
+        os.replace(temp_path, composition_path)
+        return True
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
 def update_composition_json(
     remotion_root: Path,
     phrases: list[Phrase],
@@ -496,15 +793,18 @@ def update_composition_json(
         section_backgrounds=section_backgrounds,
     )
 
-    # Build composition data using centralized builder
-    composition_data = build_composition_data(config, remotion_root)
-
-    # Write to file
-    composition_path = remotion_root / "composition.json"
-    with composition_path.open("w", encoding="utf-8") as f:
-        json.dump(composition_data, f, indent=2, ensure_ascii=False)
+    # Stream composition data to file (same content as build_composition_data)
+    persona_position_map = _build_persona_position_map(config.personas)
+    written = _write_composition_json(
+        remotion_root / "composition.json",
+        _build_composition_settings(config, remotion_root, persona_position_map),
+        _iter_composition_phrases(config, remotion_root, persona_position_map),
+    )
 
-    console.print(f"[green]✓ Updated composition.json with {len(phrases)} phrases[/green]")
+    if written:
+        console.print(f"[green]✓ Updated composition.json with {len(phrases)} phrases[/green]")
+    else:
+        console.print(f"[dim]↷ composition.json unchanged ({len(phrases)} phrases)[/dim]")
 
 
 def _get_persona_fields(
@@ -575,46 +875,7 @@ def _convert_to_public_path(asset_path: str | None) -> str | None:
     if asset_path is None:
         return None
     # If path starts with "assets/", remove it (assets are symlinked to public/)
-    if asset_path.startswith("assets/"):
-        return asset_path[7:]  # Remove "assets/" prefix
-    return asset_path
-
-
-def _has_attached_picture(file_path: Path) -> bool:
-    """Check if an audio file has an attached picture (album art).
-
-    MP3 files with embedded album art contain a video stream (usually mjpeg)
-    marked as attached_pic. This can cause playback issues in Remotion.
-
-    Args:
-        file_path: Path to the audio file.
-
-    Returns:
-        True if the file has an attached picture stream.
-    """
-    try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "stream=codec_type:stream_disposition=attached_pic",
-                "-of",
-                "csv=p=0",
-                str(file_path),
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        # Look for lines indicating video stream with attached_pic=1
-        for line in result.stdout.strip().split("\n"):
-            if "video" in line and "1" in line:
-                return True
-        return False
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return asset_path.removeprefix("assets/")
 
 
 def _strip_attached_picture(src_path: Path, dest_path: Path) -> bool:
@@ -651,6 +912,31 @@ def _strip_attached_picture(src_path: Path, dest_path: Path) -> bool:
         return False
 
 
+def _fast_copy(src: str | Path, dst: str | Path) -> str | Path:
+    """Place a copy of src at dst, hardlinking when possible.
+
+    Remotion only reads these files, so metadata is not preserved. A hardlink
+    costs no data copy; across filesystems shutil.copyfile falls back to the
+    kernel's copy_file_range/sendfile paths. An existing dst is replaced
+    (never written through, as it may itself be a hardlink to another file).
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+
+    Returns:
+        The destination path (copytree copy_function contract).
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    Path(dst).unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
 def _copy_asset_to_public(asset_path: Path, remotion_root: Path, category: str) -> str:
     """Copy asset file to Remotion public directory.
 
@@ -668,8 +954,6 @@ def _copy_asset_to_public(asset_path: Path, remotion_root: Path, category: str)
     Raises:
         FileNotFoundError: If asset file doesn't exist.
     """
-    import shutil
-
     # Resolve relative paths from project root (default: /app/)
     # This is necessary because in Docker environment, the working directory
     # is the job directory (e.g., /app/data/jobs/{job_id}/), not the project root
@@ -700,41 +984,60 @@ def _copy_asset_to_public(asset_path: Path, remotion_root: Path, category: str)
     public_category_dir.mkdir(parents=True, exist_ok=True)
 
     dest_file = public_category_dir / asset_path.name
+    stripped_marker = dest_file.with_name(dest_file.name + STRIPPED_MARKER_SUFFIX)
 
-    # For BGM files, strip attached pictures (album art) to avoid playback issues
-    if category == "bgm" and _has_attached_picture(asset_path):
-        console.print(f"[yellow]Stripping album art from BGM: {asset_path.name}[/yellow]")
-        if not _strip_attached_picture(asset_path, dest_file):
+    # Skip when a previous render already placed this asset: the destination is
+    # at least as new as the source and either the same size (plain copy) or
+    # marked as the album-art-stripped version of it
+    src_stat = asset_path.stat()
+    try:
+        dest_stat = dest_file.stat()
+    except FileNotFoundError:
+        dest_stat = None
+    if dest_stat is not None and dest_stat.st_mtime_ns >= src_stat.st_mtime_ns:
+        if dest_stat.st_size == src_stat.st_size or stripped_marker.exists():
+            return f"{category}/{asset_path.name}"
+
+    # For BGM files, strip attached pictures (album art) to avoid playback issues.
+    # Keeping only the first audio stream (stream copy) is a plain remux for
+    # audio-only files, so a single ffmpeg pass replaces probing first.
+    stripped = False
+    if category == "bgm":
+        # ffmpeg overwrites in place; never write through a hardlinked old copy
+        dest_file.unlink(missing_ok=True)
+        stripped = _strip_attached_picture(asset_path, dest_file)
+        if not stripped:
             # Fallback to simple copy if stripping fails
             console.print(
                 "[yellow]Warning: Could not strip album art, using original file[/yellow]"
             )
-            shutil.copy2(asset_path, dest_file)
+            _fast_copy(asset_path, dest_file)
     else:
         # Copy file to public directory
-        shutil.copy2(asset_path, dest_file)
+        _fast_copy(asset_path, dest_file)
+
+    if stripped:
+        stripped_marker.touch()
+    else:
+        stripped_marker.unlink(missing_ok=True)
 
     # Return path relative to public/
     return f"{category}/{asset_path.name}"
 
 
-def render_video_with_remotion(
-    composition_config: CompositionConfig,
-    render_config: RenderConfig,
-) -> None:
-    """Render video using Remotion CLI with per-project setup.
+def _prepare_render(composition_config: CompositionConfig, render_config: RenderConfig) -> Path:
+    """Prepare the Remotion project for rendering.
 
-    This function consolidates rendering execution by accepting configuration objects
-    instead of many individual parameters, improving maintainability and reducing
-    the risk of parameter mismatches.
+    Ensures the rendering environment, writes composition.json, and creates
+    the output directory.
 
     Args:
-        composition_config: Configuration for composition.json (phrases, audio, slides, etc.)
-        render_config: Configuration for rendering execution (paths, concurrency, etc.)
+        composition_config: Configuration for composition.json.
+        render_config: Configuration for rendering execution.
 
-    Raises:
-        FileNotFoundError: If Remotion is not installed.
-        RuntimeError: If video rendering fails.
+    Returns:
+        Resolved absolute output path, passed to Remotion (which runs in
+        remotion_root, so relative paths would point elsewhere).
     """
     # Ensure rendering environment is ready (dependencies, Chrome, assets)
     ensure_rendering_environment(render_config.remotion_root)
@@ -757,56 +1060,398 @@ def render_video_with_remotion(
 
     # Ensure output directory exists
     render_config.output_path.parent.mkdir(parents=True, exist_ok=True)
+    return render_config.output_path.resolve()
 
-    # Calculate total duration including pauses
-    # Use last phrase's end time (start_time + duration) + 1 second ending pause
-    if composition_config.phrases:
-        last_phrase = composition_config.phrases[-1]
-        total_duration = last_phrase.start_time + last_phrase.duration + 1.0  # +1s ending pause
-    else:
-        total_duration = 0.0
-    total_frames = int(total_duration * composition_config.fps)
+
+def render_video_with_remotion(
+    composition_config: CompositionConfig,
+    render_config: RenderConfig,
+) -> None:
+    """Render video using Remotion CLI with per-project setup.
+
+    This function consolidates rendering execution by accepting configuration objects
+    instead of many individual parameters, improving maintainability and reducing
+    the risk of parameter mismatches. It is a blocking wrapper around
+    render_video_with_remotion_async.
+
+    Args:
+        composition_config: Configuration for composition.json (phrases, audio, slides, etc.)
+        render_config: Configuration for rendering execution (paths, concurrency, etc.)
+
+    Raises:
+        FileNotFoundError: If Remotion is not installed.
+        RenderingError: If video rendering fails.
+    """
+    asyncio.run(render_video_with_remotion_async(composition_config, render_config))
+
+
+async def render_video_with_remotion_async(
+    composition_config: CompositionConfig,
+    render_config: RenderConfig,
+) -> None:
+    """Render video using Remotion CLI without blocking the event loop.
+
+    Drivers that render several projects concurrently (e.g., with
+    asyncio.gather) can await this directly. Project preparation runs in a
+    worker thread and Remotion processes are awaited via asyncio
+    subprocesses. Each concurrent render needs its own remotion_root,
+    since composition.json lives there.
+
+    Args:
+        composition_config: Configuration for composition.json (phrases, audio, slides, etc.)
+        render_config: Configuration for rendering execution (paths, concurrency, etc.)
+
+    Raises:
+        FileNotFoundError: If Remotion is not installed.
+        RenderingError: If video rendering fails.
+    """
+    output_path = await asyncio.to_thread(_prepare_render, composition_config, render_config)
+
+    total_frames = composition_config.total_frames
+    chunks = min(render_config.render_chunks, total_frames)
+    if chunks > 1:
+        await _render_in_chunks(
+            render_config, output_path, total_frames, composition_config.fps, chunks
+        )
+        return
 
     # Render video using Remotion CLI
-    try:
-        # Only show initial message when progress is hidden
-        if not render_config.show_progress:
-            console.print(
-                f"[cyan]🎬 Rendering video with Remotion "
-                f"({total_duration:.1f}s, {total_frames} frames)...[/cyan]"
+    command = _build_render_command(render_config, output_path, render_config.render_concurrency)
+
+    if render_config.show_progress:
+        # Let Remotion write progress directly to the terminal
+        proc = await asyncio.create_subprocess_exec(*command, cwd=render_config.remotion_root)
+        returncode = await proc.wait()
+        if returncode != 0:
+            console.print(f"[red]Remotion rendering failed with exit code {returncode}[/red]")
+            raise RenderingError(f"Remotion rendering failed with exit code {returncode}")
+        return
+
+    console.print(
+        f"[cyan]🎬 Rendering video with Remotion "
+        f"({composition_config.total_duration:.1f}s, {total_frames} frames)...[/cyan]"
+    )
+
+    returncode, output_tail = await _run_with_output_tail_async(
+        command, cwd=render_config.remotion_root
+    )
+    if returncode != 0:
+        console.print(f"[red]Remotion rendering failed:\n{output_tail}[/red]")
+        raise RenderingError(f"Remotion rendering failed with exit code {returncode}")
+
+    console.print(f"[green]✓ Video rendered: {render_config.output_path}[/green]")
+
+
+def _remotion_cli(remotion_root: Path) -> list[str]:
+    """Return the command prefix invoking the Remotion CLI.
+
+    The project-local binary installed by pnpm is preferred: invoking it
+    directly skips npx's package resolution on every render.
+
+    Args:
+        remotion_root: Path to Remotion project root directory.
+
+    Returns:
+        Command prefix to which Remotion subcommands are appended.
+    """
+    local_cli = remotion_root / "node_modules" / ".bin" / "remotion"
+    if local_cli.exists():
+        return [str(local_cli.absolute())]
+    return ["npx", "remotion"]
+
+
+def _build_render_command(
+    render_config: RenderConfig,
+    output_path: Path,
+    concurrency: int,
+    frame_range: tuple[int, int] | None = None,
+    serve_url: Path | None = None,
+    muted: bool = False,
+) -> list[str]:
+    """Build the `remotion render` command line.
+
+    Args:
+        render_config: Configuration for rendering execution.
+        output_path: Absolute path of the video file to write.
+        concurrency: Number of frames Remotion renders concurrently.
+        frame_range: Optional inclusive (first, last) frame range to render.
+        serve_url: Optional pre-built bundle directory to render from instead
+            of bundling the project's entry point.
+        muted: Render the video without an audio track.
+
+    Returns:
+        Command and arguments as list.
+    """
+    command = [
+        *_remotion_cli(render_config.remotion_root),
+        "render",
+        *([os.fspath(serve_url)] if serve_url is not None else []),
+        "VideoGenerator",
+        os.fspath(output_path),
+        "--overwrite",
+        "--concurrency",
+        str(concurrency),
+        "--timeout",
+        str(render_config.render_timeout_seconds * 1000),  # Convert seconds to milliseconds
+        "--crf",
+        str(render_config.crf),
+    ]
+    if muted:
+        command.append("--muted")
+    if frame_range is not None:
+        command.append(f"--frames={frame_range[0]}-{frame_range[1]}")
+    return command
+
+
+def _build_audio_render_command(
+    render_config: RenderConfig, serve_url: Path, output_path: Path
+) -> list[str]:
+    """Build the `remotion render` command line for the audio track alone.
+
+    The track is rendered as uncompressed WAV, whose exact sample count
+    gives the composition's length as Remotion computed it.
+
+    Args:
+        render_config: Configuration for rendering execution.
+        serve_url: Pre-built bundle directory to render from.
+        output_path: Absolute path of the WAV file to write.
+
+    Returns:
+        Command and arguments as list.
+    """
+    return [
+        *_remotion_cli(render_config.remotion_root),
+        "render",
+        os.fspath(serve_url),
+        "VideoGenerator",
+        os.fspath(output_path),
+        "--overwrite",
+        "--codec=wav",
+        "--timeout",
+        str(render_config.render_timeout_seconds * 1000),  # Convert seconds to milliseconds
+    ]
+
+
+async def _bundle_remotion_project(remotion_root: Path, bundle_dir: Path) -> None:
+    """Bundle the Remotion project once so several renders can share it.
+
+    Args:
+        remotion_root: Path to Remotion project root directory.
+        bundle_dir: Directory to write the bundle to (must not exist yet).
+
+    Raises:
+        RenderingError: If bundling fails.
+    """
+    command = [*_remotion_cli(remotion_root), "bundle", "--out-dir", os.fspath(bundle_dir)]
+    returncode, output_tail = await _run_with_output_tail_async(command, cwd=remotion_root)
+    if returncode != 0:
+        console.print(f"[red]Remotion bundling failed:\n{output_tail}[/red]")
+        raise RenderingError(f"Remotion bundling failed with exit code {returncode}")
+
+
+def _split_frame_ranges(total_frames: int, chunks: int) -> list[tuple[int, int]]:
+    """Split [0, total_frames) into contiguous inclusive frame ranges of near-equal size.
+
+    Args:
+        total_frames: Total number of frames in the composition.
+        chunks: Number of ranges to produce (at most total_frames).
+
+    Returns:
+        List of (first_frame, last_frame) tuples covering every frame once.
+    """
+    bounds = [total_frames * k // chunks for k in range(chunks + 1)]
+    return [(bounds[k], bounds[k + 1] - 1) for k in range(chunks)]
+
+
+def _wav_duration_frames(wav_path: Path, fps: int) -> int:
+    """Return the length of a WAV file in video frames.
+
+    Args:
+        wav_path: Path to the WAV file.
+        fps: Video frame rate.
+
+    Returns:
+        Number of video frames the audio spans, rounded to the nearest frame.
+    """
+    with wave.open(os.fspath(wav_path), "rb") as wav_file:
+        return round(wav_file.getnframes() * fps / wav_file.getframerate())
+
+
+async def _render_in_chunks(
+    render_config: RenderConfig,
+    output_path: Path,
+    total_frames: int,
+    fps: int,
+    chunks: int,
+) -> None:
+    """Render frame ranges in parallel Remotion processes and join them with ffmpeg.
+
+    The project is bundled once and every process renders from that bundle.
+    Each chunk renders its frame range muted with an equal share of
+    render_concurrency, while one more process renders the whole audio track.
+    ffmpeg then concatenates the video parts without re-encoding and muxes
+    the single audio track over them, so chunk boundaries never split the
+    audio (per-part AAC tracks would leave gaps or clicks at every join).
+
+    The frame ranges come from CompositionConfig.total_frames, which mirrors
+    calculateTotalFrames() in the TSX. The audio track spans Remotion's own
+    frame count, so if the two disagree the render fails instead of silently
+    dropping frames at the end.
+
+    Live Remotion progress cannot be shown for several processes at once;
+    with show_progress, each chunk is reported as it completes instead.
+
+    Args:
+        render_config: Configuration for rendering execution.
+        output_path: Absolute path of the joined video, as resolved by _prepare_render.
+        total_frames: Total number of frames in the composition.
+        fps: Video frame rate.
+        chunks: Number of parallel Remotion processes.
+
+    Raises:
+        RenderingError: If bundling, any chunk, the audio track, or the final
+            concatenation fails, or the frame count disagrees with Remotion's.
+    """
+    concurrency = max(1, render_config.render_concurrency // chunks)
+    frame_ranges = _split_frame_ranges(total_frames, chunks)
+
+    console.print(
+        f"[cyan]🎬 Rendering video with Remotion in {chunks} parallel chunks "
+        f"({total_frames} frames)...[/cyan]"
+    )
+    if render_config.show_progress:
+        console.print(
+            "[yellow]Live Remotion progress is not shown for parallel chunks; "
+            "reporting each chunk as it completes[/yellow]"
+        )
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as temp_dir:
+        work_dir = Path(temp_dir)
+        bundle_dir = work_dir / "bundle"
+        part_paths = [work_dir / f"part{k:02d}{output_path.suffix}" for k in range(chunks)]
+        audio_path = work_dir / "audio.wav"
+        concat_list_path = work_dir / "parts.txt"
+
+        await _bundle_remotion_project(render_config.remotion_root, bundle_dir)
+
+        commands = [
+            _build_render_command(
+                render_config,
+                part_path,
+                concurrency,
+                frame_range,
+                serve_url=bundle_dir,
+                muted=True,
+            )
+            for part_path, frame_range in zip(part_paths, frame_ranges, strict=True)
+        ]
+        commands.append(_build_audio_render_command(render_config, bundle_dir, audio_path))
+        labels = [f"frames {first}-{last}" for first, last in frame_ranges] + ["audio"]
+
+        async def render_part(label: str, command: list[str]) -> tuple[int, str]:
+            result = await _run_with_output_tail_async(command, cwd=render_config.remotion_root)
+            if render_config.show_progress and result[0] == 0:
+                console.print(f"[green]✓ Rendered {label}[/green]")
+            return result
+
+        results = await asyncio.gather(
+            *(render_part(label, command) for label, command in zip(labels, commands, strict=True))
+        )
+        for label, (returncode, output_tail) in zip(labels, results, strict=True):
+            if returncode != 0:
+                console.print(f"[red]Remotion rendering failed for {label}:\n{output_tail}[/red]")
+                raise RenderingError(f"Remotion rendering failed with exit code {returncode}")
+
+        remotion_frames = _wav_duration_frames(audio_path, fps)
+        if remotion_frames != total_frames:
+            raise RenderingError(
+                f"Remotion composition is {remotion_frames} frames long, but "
+                f"{total_frames} frames were rendered; calculateTotalFrames() and "
+                "CompositionConfig.total_frames disagree"
             )
 
-        # Run rendering (always execute, regardless of show_progress)
-        subprocess.run(
+        concat_list_path.write_bytes(
+            "".join(concat_list_line(part) for part in part_paths).encode("utf-8")
+        )
+        returncode, output_tail = await _run_with_output_tail_async(
             [
-                "npx",
-                "remotion",
-                "render",
-                "VideoGenerator",
-                str(render_config.output_path.absolute()),
-                "--overwrite",
-                "--concurrency",
-                str(render_config.render_concurrency),
-                "--timeout",
-                str(render_config.render_timeout_seconds * 1000),  # Convert seconds to milliseconds
-                "--crf",
-                str(render_config.crf),
+                "ffmpeg",
+                "-y",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(concat_list_path),
+                "-i",
+                str(audio_path),
+                "-map",
+                "0:v:0",
+                "-map",
+                "1:a:0",
+                "-c:v",
+                "copy",
+                "-c:a",
+                "aac",
+                "-b:a",
+                CHUNKED_AUDIO_BITRATE,
+                str(output_path),
             ],
-            cwd=render_config.remotion_root,
-            check=True,
-            # Show progress only if requested
-            capture_output=not render_config.show_progress,
-            text=True,
+            cwd=work_dir,
         )
+        if returncode != 0:
+            console.print(f"[red]Failed to join rendered chunks:\n{output_tail}[/red]")
+            raise RenderingError("Joining rendered video chunks failed")
 
-        # Only show completion message when progress is hidden
-        if not render_config.show_progress:
-            console.print(f"[green]✓ Video rendered: {render_config.output_path}[/green]")
+    console.print(f"[green]✓ Video rendered: {output_path}[/green]")
 
-    except subprocess.CalledProcessError as e:
-        if render_config.show_progress:
-            console.print(f"[red]Remotion rendering failed with exit code {e.returncode}[/red]")
-        else:
-            error_msg = f"Remotion rendering failed:\nSTDOUT:\n{e.stdout}\nSTDERR:\n{e.stderr}"
-            console.print(f"[red]{error_msg}[/red]")
-        raise RenderingError(f"Remotion rendering failed with exit code {e.returncode}") from e
+
+async def _run_with_output_tail_async(
+    command: list[str],
+    cwd: Path,
+    max_lines: int = RENDER_OUTPUT_TAIL_LINES,
+) -> tuple[int, str]:
+    """Run a command, keeping only the last lines of its combined output.
+
+    Output is read in fixed-size chunks rather than by line, so a single
+    huge line cannot overrun the stream reader's limit. Lines are kept as
+    raw bytes in a bounded buffer (an over-long line keeps only its end),
+    so memory stays flat for long renders and decoding only happens once.
+    If reading fails or the caller is cancelled, the child is killed and
+    reaped before the error propagates.
+
+    Args:
+        command: Command and arguments as list.
+        cwd: Working directory for command execution.
+        max_lines: Number of trailing output lines to keep.
+
+    Returns:
+        Tuple of (return code, decoded tail of stdout/stderr).
+
+    Raises:
+        RenderingError: If the command's output cannot be read.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    assert proc.stdout is not None
+    tail: deque[bytes] = deque(maxlen=max_lines)
+    partial = b""
+    try:
+        while chunk := await proc.stdout.read(RENDER_OUTPUT_BUFFER_SIZE):
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()[-RENDER_OUTPUT_BUFFER_SIZE:]
+            tail.extend(line[-RENDER_OUTPUT_BUFFER_SIZE:] + b"\n" for line in lines)
+        returncode = await proc.wait()
+    except (OSError, ValueError) as e:
+        raise RenderingError(f"Failed to read output of {command[0]}: {e}") from e
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    if partial:
+        tail.append(partial)
+    return returncode, b"".join(tail).decode("utf-8", errors="replace")
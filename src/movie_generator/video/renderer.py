@@ -3,15 +3,43 @@
 Generates composition.json and renders video using Remotion.
 """
 
+import functools
+import hashlib
+import io
 import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import tempfile
 from pathlib import Path
 from typing import Any
 
+from PIL import Image
 from pydantic import BaseModel, Field
 
 from ..constants import ProjectPaths
 from ..script.phrases import Phrase
 
+# ffmpeg otherwise writes a progress line to stderr for every stats period;
+# with capture_output that whole log would be buffered in memory. Errors are
+# still reported on stderr for the error messages below.
+_FFMPEG_QUIET_ARGS = ("-hide_banner", "-nostats", "-loglevel", "error")
+
+# Slide filenames follow ProjectPaths.SLIDE_FILENAME_FORMAT ("slide_0003.png")
+SLIDE_FILENAME_RE = re.compile(r"slide_(\d{4})\.png")
+
+# Sidecar next to a rendered video holding the hash of the composition it was
+# rendered from ("video.mp4.sig")
+RENDER_SIGNATURE_SUFFIX = ".sig"
+
+# x264 settings for the still-image video written by render_video. ultrafast
+# would disable CABAC and most other tools and produce a noticeably larger
+# file; veryfast keeps them while still encoding a static frame quickly
+STILL_IMAGE_PRESET = "veryfast"
+STILL_IMAGE_CRF = 28  # Constant Rate Factor (0-51, lower = higher quality)
+
 
 class CompositionPhrase(BaseModel):
     """A phrase in the composition with audio and slide information.
@@ -75,6 +103,31 @@ class CompositionConfig(BaseModel):
     bgm: dict[str, Any] | None = None
     section_backgrounds: dict[int, dict[str, Any]] | None = None
 
+    @property
+    def total_duration(self) -> float:
+        """Total video duration in seconds, including the ending pause.
+
+        Derived from total_frames so the reported duration always matches
+        the frames Remotion renders.
+        """
+        return self.total_frames / self.fps
+
+    @property
+    def total_frames(self) -> int:
+        """Total video length in frames at the configured fps.
+
+        Mirrors calculateTotalFrames() in the generated VideoGenerator.tsx
+        (rounded start and duration frames of the last phrase plus a one second
+        ending pause), so frame ranges passed to Remotion stay in bounds.
+        """
+        if not self.phrases:
+            return 0
+        last_phrase = self.phrases[-1]
+        # JavaScript Math.round semantics (round half up)
+        start_frame = math.floor(last_phrase.start_time * self.fps + 0.5)
+        duration_frames = math.floor(last_phrase.duration * self.fps + 0.5)
+        return start_frame + duration_frames + self.fps
+
 
 class RenderConfig(BaseModel):
     """Configuration for Remotion video rendering execution.
@@ -92,6 +145,7 @@ class RenderConfig(BaseModel):
     crf: int = 28  # Constant Rate Factor (0-51, lower = higher quality)
     render_concurrency: int = 4
     render_timeout_seconds: int = 300
+    render_chunks: int = 1  # Frame ranges rendered by parallel Remotion processes
 
 
 def create_composition(
@@ -118,25 +172,27 @@ def create_composition(
         Composition data object.
     """
     # Build slide map: section_index -> slide path
+    # (section index from the filename, e.g., "slide_0003.png" -> 3)
+    # Single pass also collects the stringified paths stored in the composition
     slide_map: dict[int, str] = {}
+    slide_strs: list[str] = []
     for slide_path in slide_paths:
-        # Extract section index from filename (e.g., "slide_0003.png" -> 3)
+        slide_strs.append(os.fspath(slide_path))
         filename = slide_path.name
-        if filename.startswith("slide_") and filename.endswith(".png"):
-            try:
-                section_index = int(filename[6:10])  # Extract "0003" part
-                # Convert to relative path from slides directory
-                slide_map[section_index] = f"slides/ja/{filename}"
-            except ValueError:
-                pass
-
-    # Create phrase data with slide files
+        match = SLIDE_FILENAME_RE.fullmatch(filename)
+        if match:
+            # Convert to relative path from slides directory
+            slide_map[int(match.group(1))] = f"slides/ja/{filename}"
+
+    # Create phrase data with slide files (audio name template bound once,
+    # so each phrase costs a single str.format call)
+    format_audio_file = f"audio/{ProjectPaths.PHRASE_FILENAME_FORMAT}".format
     composition_phrases = [
         CompositionPhrase(
             text=p.text,
             duration=p.duration,
             start_time=p.start_time,
-            audioFile=f"audio/{ProjectPaths.PHRASE_FILENAME_FORMAT.format(index=p.original_index)}",
+            audioFile=format_audio_file(index=p.original_index),
             slideFile=slide_map.get(p.section_index),
         )
         for p in phrases
@@ -148,8 +204,8 @@ def create_composition(
         width=resolution[0],
         height=resolution[1],
         phrases=composition_phrases,
-        slides=[str(p) for p in slide_paths],
-        audio_files=[str(p) for p in audio_paths],
+        slides=slide_strs,
+        audio_files=[os.fspath(p) for p in audio_paths],
         transition=transition,
     )
 
@@ -161,8 +217,96 @@ def save_composition(composition: CompositionData, output_path: Path) -> None:
         composition: Composition data.
         output_path: Path to save JSON file.
     """
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(composition.model_dump(), f, ensure_ascii=False, indent=2)
+    # Serialize directly from the model in pydantic's Rust core instead of
+    # building an intermediate dict tree for json.dump
+    output_path.write_text(composition.model_dump_json(indent=2), encoding="utf-8")
+
+
+def concat_list_line(path: str | Path) -> str:
+    """Format one entry of an ffmpeg concat demuxer list.
+
+    Inside the single-quoted path, a literal quote must be written as '\\''
+    (close quote, escaped quote, reopen); otherwise filenames containing a
+    quote break the list.
+
+    Args:
+        path: File path to list.
+
+    Returns:
+        Line of the form "file '<path>'" including the trailing newline.
+    """
+    escaped = os.fspath(path).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _black_png(width: int, height: int) -> bytes:
+    """Encode a black placeholder PNG of the given size.
+
+    Cached in-process, so renders without slides encode it only once per
+    resolution. Callers write it into their private per-render temp
+    directory rather than a shared location other users could pre-create.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        PNG file content.
+    """
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _existing_files(paths: list[str]) -> list[str]:
+    """Filter paths to those that exist, listing each directory only once.
+
+    Phrase audio files share one directory, so a single scandir replaces a
+    stat call per file.
+
+    Args:
+        paths: File paths (absolute or relative to the cwd).
+
+    Returns:
+        Paths that exist, in their original order.
+    """
+    listings: dict[str, set[str]] = {}
+    existing = []
+    for path in paths:
+        directory, name = os.path.split(path)
+        names = listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            listings[directory] = names
+        if name in names:
+            existing.append(path)
+    return existing
+
+
+def _is_nonempty_file(path: str | Path) -> bool:
+    """Check that a file exists and is not empty with a single stat call."""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def _composition_signature(composition_bytes: bytes) -> str:
+    """Hash the raw composition.json contents for the render skip check."""
+    return hashlib.blake2b(composition_bytes, digest_size=16).hexdigest()
+
+
+def _read_signature(signature_path: Path) -> str | None:
+    """Read a render signature sidecar, returning None if it is missing."""
+    try:
+        return signature_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
 
 
 def render_video(
@@ -179,13 +323,13 @@ def render_video(
         FileNotFoundError: If ffmpeg is not found.
         RuntimeError: If video rendering fails.
     """
-    import json
-    import shutil
-    import subprocess
-    from pathlib import Path
+    composition_bytes = composition_path.read_bytes()
+    signature = _composition_signature(composition_bytes)
+    signature_path = output_path.with_name(output_path.name + RENDER_SIGNATURE_SUFFIX)
 
-    # Skip if video already exists and is not empty
-    if output_path.exists() and output_path.stat().st_size > 0:
+    # Skip if video already exists, is not empty and was rendered from this
+    # exact composition
+    if _is_nonempty_file(output_path) and _read_signature(signature_path) == signature:
         print(f"↷ Skipping existing video: {output_path.name}")
         return
 
@@ -196,8 +340,7 @@ def render_video(
         )
 
     # Load composition data
-    with composition_path.open("r", encoding="utf-8") as f:
-        composition = json.load(f)
+    composition = json.loads(composition_bytes)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -215,100 +358,83 @@ def render_video(
         output_path.write_bytes(b"")
         return
 
-    # Create a concat file for audio
-    audio_list_path = output_path.parent / "audio_concat.txt"
-    with audio_list_path.open("w", encoding="utf-8") as f:
-        for audio_file in audio_files:
-            if Path(audio_file).exists():
-                f.write(f"file '{Path(audio_file).absolute()}'\n")
-
-    # Concatenate all audio files
-    temp_audio = output_path.parent / "temp_audio.wav"
-    try:
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                str(audio_list_path),
-                "-c",
-                "copy",
-                str(temp_audio),
-                "-y",
-            ],
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"Error concatenating audio: {e.stderr.decode()}")
-        output_path.write_bytes(b"")
-        return
-
-    # Create video from first slide (or black image if no slides)
-    if slides and Path(slides[0]).exists() and Path(slides[0]).stat().st_size > 0:
-        # Use first slide as static image
-        input_image = slides[0]
-    else:
-        # Create a black image
-        temp_image = output_path.parent / "temp_black.png"
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-f",
-                "lavfi",
-                "-i",
-                f"color=c=black:s={width}x{height}:d=1",
-                str(temp_image),
-                "-y",
-            ],
-            check=True,
-            capture_output=True,
-        )
-        input_image = temp_image
-
-    # Create video from image and audio
-    try:
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-loop",
-                "1",
-                "-i",
-                str(input_image),
-                "-i",
-                str(temp_audio),
-                "-c:v",
-                "libx264",
-                "-tune",
-                "stillimage",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "192k",
-                "-pix_fmt",
-                "yuv420p",
-                "-shortest",
-                "-r",
-                str(fps),
-                str(output_path),
-                "-y",
-            ],
-            check=True,
-            capture_output=True,
-        )
-        print(f"✓ Video rendered: {output_path}")
-    except subprocess.CalledProcessError as e:
-        print(f"Error rendering video: {e.stderr.decode()}")
-        output_path.write_bytes(b"")
-    finally:
-        # Cleanup temporary files
-        if audio_list_path.exists():
-            audio_list_path.unlink()
-        if temp_audio.exists():
-            temp_audio.unlink()
-        temp_image = output_path.parent / "temp_black.png"
-        if temp_image.exists():
-            temp_image.unlink()
+    # Absolute paths (the concat list is resolved relative to the list file, not
+    # the cwd); joining onto a single getcwd() leaves absolute entries unchanged
+    cwd = os.getcwd()
+    existing_audio = [os.path.join(cwd, audio_file) for audio_file in _existing_files(audio_files)]
+
+    # A single audio file is used as the audio input directly; several are
+    # joined through a concat list. Intermediates live in a per-render temp
+    # directory so concurrent renders into the same folder never collide and
+    # nothing is left behind if the render is interrupted
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as temp_dir:
+        if len(existing_audio) == 1:
+            audio_input_args = ["-i", existing_audio[0]]
+        else:
+            audio_list_path = Path(temp_dir) / "audio_concat.txt"
+            audio_list_path.write_bytes(
+                "".join(concat_list_line(audio_file) for audio_file in existing_audio).encode(
+                    "utf-8"
+                )
+            )
+            audio_input_args = ["-f", "concat", "-safe", "0", "-i", str(audio_list_path)]
+
+        # Create video from first slide (or black image if no slides)
+        if slides and _is_nonempty_file(slides[0]):
+            # Use first slide as static image
+            input_image = slides[0]
+        else:
+            # Use a black image
+            input_image = Path(temp_dir) / "black.png"
+            input_image.write_bytes(_black_png(width, height))
+
+        # Create video from image and audio. The concat demuxer feeds the audio
+        # files straight into the AAC encoder, so no intermediate WAV is written
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    *_FFMPEG_QUIET_ARGS,
+                    # Read the still image at 1 fps and convert it to yuv420p before
+                    # the fps filter duplicates frames up to the output rate, so the
+                    # decode and colorspace conversion run once per second of video
+                    # instead of once per output frame
+                    "-loop",
+                    "1",
+                    "-framerate",
+                    "1",
+                    "-i",
+                    str(input_image),
+                    *audio_input_args,
+                    "-vf",
+                    f"format=yuv420p,fps={fps}",
+                    "-c:v",
+                    "libx264",
+                    "-tune",
+                    "stillimage",
+                    "-preset",
+                    STILL_IMAGE_PRESET,
+                    "-crf",
+                    str(STILL_IMAGE_CRF),
+                    # A keyframe every 10 s keeps seeking cheap without bloating
+                    # the stream
+                    "-g",
+                    str(fps * 10),
+                    "-c:a",
+                    "aac",
+                    "-b:a",
+                    "192k",
+                    "-pix_fmt",
+                    "yuv420p",
+                    "-shortest",
+                    str(output_path),
+                    "-y",
+                ],
+                check=True,
+                capture_output=True,
+            )
+            signature_path.write_text(signature, encoding="utf-8")
+            print(f"✓ Video rendered: {output_path}")
+        except subprocess.CalledProcessError as e:
+            print(f"Error rendering video: {e.stderr.decode()}")
+            output_path.write_bytes(b"")
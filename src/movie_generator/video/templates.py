@@ -1,16 +1,43 @@
 """TypeScript/React templates for Remotion video generation.
 
-This module contains template strings for generating Remotion project files.
-Each template is a Python string that can be formatted with project-specific data.
+The Remotion source files (VideoGenerator.tsx, Root.tsx, index.ts,
+remotion.config.ts) are bundled as package data under
+movie_generator/templates/remotion/ and read on first use. JSON config files
+are built here from Python data.
 
 IMPORTANT: Subtitle default color is defined in constants.py (SubtitleConstants.DEFAULT_COLOR).
 When generating TypeScript templates, this value is embedded directly into the code.
 """
 
+import functools
+import importlib.resources
+import json
 from typing import Any
 
 from ..constants import SubtitleConstants
 
+# Directory of the Remotion source templates inside the movie_generator.templates package
+_TEMPLATE_DIR = "remotion"
+
+# Placeholder in VideoGenerator.tsx for SubtitleConstants.DEFAULT_COLOR. It uses
+# no braces so it cannot be mistaken for, or collide with, a JSX expression.
+_DEFAULT_SUBTITLE_COLOR_PLACEHOLDER = "__DEFAULT_SUBTITLE_COLOR__"
+
+
+@functools.cache
+def _load_template(name: str) -> str:
+    """Read a bundled Remotion template once and keep it for later calls."""
+    template_pkg = importlib.resources.files("movie_generator.templates")
+    return (template_pkg / _TEMPLATE_DIR / name).read_text(encoding="utf-8")
+
+
+@functools.cache
+def _render_video_generator_tsx() -> str:
+    """Substitute the default subtitle color into VideoGenerator.tsx once."""
+    return _load_template("VideoGenerator.tsx").replace(
+        _DEFAULT_SUBTITLE_COLOR_PLACEHOLDER, SubtitleConstants.DEFAULT_COLOR
+    )
+
 
 def get_video_generator_tsx(
     transition_type: str = "fade",
@@ -33,594 +60,10 @@ def get_video_generator_tsx(
     Note:
         Uses TransitionSeries from @remotion/transitions for smooth transitions.
         Configuration is read from composition.json at runtime.
+        The template is loaded and rendered on first use; every call returns
+        the same string.
     """
-    return """import React from 'react';
-import { AbsoluteFill, Audio, Img, Loop, OffthreadVideo, Sequence, staticFile, useCurrentFrame, useVideoConfig } from 'remotion';
-import { TransitionSeries, springTiming, linearTiming } from '@remotion/transitions';
-import { fade } from '@remotion/transitions/fade';
-import { slide } from '@remotion/transitions/slide';
-import { wipe } from '@remotion/transitions/wipe';
-import { flip } from '@remotion/transitions/flip';
-import { clockWipe } from '@remotion/transitions/clock-wipe';
-import { none } from '@remotion/transitions/none';
-import compositionData from '../composition.json';
-
-// Type definition for phrase metadata
-export interface PhraseData {
-  text: string;
-  audioFile: string;
-  slideFile?: string;
-  duration: number;
-  start_time?: number;  // Start time in seconds (for speaker pauses)
-  personaId?: string;
-  personaName?: string;
-  subtitleColor?: string;
-  characterImage?: string;
-  characterPosition?: 'left' | 'right' | 'center';
-  mouthOpenImage?: string;
-  eyeCloseImage?: string;
-  animationStyle?: 'bounce' | 'sway' | 'static';
-  backgroundOverride?: {
-    type: 'image' | 'video';
-    path: string;
-    fit?: 'cover' | 'contain' | 'fill';
-  };
-}
-
-// Props interface
-export interface VideoGeneratorProps {
-  phrases: PhraseData[];
-}
-
-// Calculate timing for each phrase
-// Note: If start_time is provided (for speaker pauses), use it directly.
-// Otherwise, calculate continuous timing based on duration.
-// Audio sequences use the provided timing (with pauses between speakers).
-// Transitions create visual overlap between slides, but audio plays continuously.
-// The total video duration accounts for transition overlaps in calculateTotalFrames().
-const getScenesWithTiming = (phrases: PhraseData[]) => {
-  const fps = (compositionData as any).fps || 30;
-
-  return phrases.map((phrase, index) => {
-    // Use start_time if provided (e.g., with speaker pauses), otherwise calculate
-    const startFrame = phrase.start_time !== undefined
-      ? Math.round(phrase.start_time * fps)
-      : (index === 0 ? 0 : Math.round(phrases.slice(0, index).reduce((sum, p) => sum + p.duration, 0) * fps));
-    const durationFrames = Math.round(phrase.duration * fps);
-
-    const scene = {
-      id: `phrase-${index}`,
-      audioFile: phrase.audioFile,
-      subtitle: phrase.text,
-      slideFile: phrase.slideFile,
-      startFrame,
-      durationFrames,
-      endFrame: startFrame + durationFrames,
-      personaId: phrase.personaId,
-      personaName: phrase.personaName,
-      subtitleColor: phrase.subtitleColor,
-      characterImage: phrase.characterImage,
-      characterPosition: phrase.characterPosition,
-      mouthOpenImage: phrase.mouthOpenImage,
-      eyeCloseImage: phrase.eyeCloseImage,
-      animationStyle: phrase.animationStyle,
-    };
-    return scene;
-  });
-};
-
-// Helper to group consecutive scenes with the same slide
-// Build slide groups with transition compensation
-// TransitionSeries causes slides to overlap during transitions, so we need to
-// extend each slide's duration to compensate for the transition time that gets
-// "consumed" by the overlap. Without this, slides appear to change before
-// the audio for that section finishes.
-const getSlideGroups = (
-  scenes: ReturnType<typeof getScenesWithTiming>,
-  transitionDurationFrames: number = 0
-) => {
-  const groups: Array<{
-    slideFile?: string;
-    scenes: ReturnType<typeof getScenesWithTiming>;
-    durationFrames: number;
-  }> = [];
-
-  let currentSlide: string | undefined = undefined;
-  let currentScenes: typeof scenes = [];
-
-  scenes.forEach((scene, index) => {
-    if (scene.slideFile !== currentSlide) {
-      // Slide changed, save previous group
-      if (index > 0 && currentScenes.length > 0) {
-        // Calculate duration from first scene's start to NEXT scene's start
-        // This includes all pauses (speaker and slide) until the next slide begins
-        const firstScene = currentScenes[0];
-        const duration = scene.startFrame - firstScene.startFrame;
-        groups.push({
-          slideFile: currentSlide,
-          scenes: currentScenes,
-          durationFrames: duration,
-        });
-        currentScenes = [];
-      }
-      currentSlide = scene.slideFile;
-    }
-    currentScenes.push(scene);
-
-    // Last scene
-    if (index === scenes.length - 1) {
-      // For the last group, extend duration by 1 second
-      // to keep the final slide visible after audio ends
-      const firstScene = currentScenes[0];
-      const lastScene = currentScenes[currentScenes.length - 1];
-      const fps = (compositionData as any).fps || 30;
-      const endingPauseFrames = fps; // 1.0 second
-      const duration = lastScene.endFrame - firstScene.startFrame + endingPauseFrames;
-      groups.push({
-        slideFile: currentSlide,
-        scenes: currentScenes,
-        durationFrames: duration,
-      });
-    }
-  });
-
-  // Add transition duration compensation to all groups except the last one.
-  // In TransitionSeries, the transition duration is shared between adjacent slides,
-  // effectively shortening each slide's visible time. By adding the full transition
-  // duration to each non-final slide, we ensure the slide remains visible for the
-  // full duration of its associated audio.
-  return groups.map((group, index) => {
-    if (index < groups.length - 1) {
-      return {
-        ...group,
-        durationFrames: group.durationFrames + transitionDurationFrames,
-      };
-    }
-    return group;
-  });
-};
-
-// Get transition presentation based on type
-const getTransitionPresentation = (type: string) => {
-  switch (type) {
-    case 'fade':
-      return fade();
-    case 'slide':
-      return slide();
-    case 'wipe':
-      return wipe();
-    case 'flip':
-      return flip();
-    case 'clockWipe':
-      return clockWipe();
-    case 'none':
-      return none();
-    default:
-      return fade();
-  }
-};
-
-// Get transition timing based on configuration
-const getTransitionTiming = (timing: string, durationInFrames: number) => {
-  if (timing === 'spring') {
-    return springTiming({ config: { damping: 200 } });
-  }
-  return linearTiming({ durationInFrames });
-};
-
-// BackgroundLayer component
-// Uses OffthreadVideo with Loop for smooth video background playback
-const BackgroundLayer: React.FC<{
-  type?: 'image' | 'video';
-  path?: string;
-  fit?: 'cover' | 'contain' | 'fill';
-  loopDurationInFrames?: number;
-}> = ({ type, path, fit = 'cover', loopDurationInFrames = 150 }) => {
-  if (!path) {
-    // No background configured - return black background
-    return <AbsoluteFill style={{ backgroundColor: '#000000' }} />;
-  }
-
-  const objectFit = fit === 'fill' ? 'fill' : fit;
-
-  if (type === 'video') {
-    // Use Loop + OffthreadVideo for smooth looping
-    // OffthreadVideo extracts frames using FFmpeg for accurate frame rendering
-    return (
-      <AbsoluteFill>
-        <Loop durationInFrames={loopDurationInFrames}>
-          <OffthreadVideo
-            src={staticFile(path)}
-            style={{
-              width: '100%',
-              height: '100%',
-              objectFit: objectFit,
-            }}
-            muted
-          />
-        </Loop>
-      </AbsoluteFill>
-    );
-  }
-
-  // Default to image
-  return (
-    <AbsoluteFill>
-      <Img
-        src={staticFile(path)}
-        style={{
-          width: '100%',
-          height: '100%',
-          objectFit: objectFit,
-        }}
-      />
-    </AbsoluteFill>
-  );
-};
-
-const SlideLayer: React.FC<{
-  slideFile?: string;
-}> = ({ slideFile }) => {
-  if (!slideFile) {
-    return (
-      <AbsoluteFill
-        style={{
-          display: 'flex',
-          alignItems: 'center',
-          justifyContent: 'center',
-          color: 'white',
-          fontSize: '48px',
-          fontFamily: 'Arial, sans-serif',
-        }}
-      >
-        <div>なんでも解説動画ジェネレーター</div>
-      </AbsoluteFill>
-    );
-  }
-
-  return (
-    <AbsoluteFill
-      style={{
-        display: 'flex',
-        alignItems: 'center',
-        justifyContent: 'center',
-      }}
-    >
-      <div style={{ width: '80%', height: '80%', display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
-        <Img
-          src={staticFile(slideFile)}
-          style={{
-            maxWidth: '100%',
-            maxHeight: '100%',
-            objectFit: 'contain',
-          }}
-        />
-      </div>
-    </AbsoluteFill>
-  );
-};
-
-const CharacterLayer: React.FC<{
-  characterImage?: string;
-  characterPosition?: 'left' | 'right' | 'center';
-  mouthOpenImage?: string;
-  eyeCloseImage?: string;
-  animationStyle?: 'bounce' | 'sway' | 'static';
-  isSpeaking?: boolean;
-  startFrame?: number;
-  endFrame?: number;
-}> = ({
-  characterImage,
-  characterPosition = 'left',
-  mouthOpenImage,
-  eyeCloseImage,
-  animationStyle = 'sway',
-  isSpeaking = true,
-}) => {
-  const frame = useCurrentFrame();
-  const { fps } = useVideoConfig();
-
-  if (!characterImage) {
-    return null;
-  }
-
-  // Position calculation
-  // Negative values push characters further outside to avoid slide overlap
-  const getPosition = () => {
-    const positions = {
-      left: { left: '-50px', bottom: '20px' },
-      right: { right: '-50px', bottom: '20px' },
-      center: { left: '50%', bottom: '20px', transform: 'translateX(-50%)' },
-    };
-    return positions[characterPosition];
-  };
-
-  // Phase 3: Animation transform (sway/bounce)
-  const getAnimationTransform = () => {
-    if (animationStyle === 'static') {
-      return '';
-    }
-
-    const time = frame / fps;
-
-    if (animationStyle === 'sway') {
-      // Gentle side-to-side sway (2-second cycle)
-      const swayAmount = Math.sin(time * Math.PI) * 5; // ±5px
-      return `translateX(${swayAmount}px)`;
-    }
-
-    if (animationStyle === 'bounce') {
-      // Vertical bounce (1.5-second cycle)
-      const bounceAmount = Math.abs(Math.sin(time * Math.PI * 1.333)) * 10; // 0-10px
-      return `translateY(-${bounceAmount}px)`;
-    }
-
-    return '';
-  };
-
-  // Phase 2: Lip sync and blinking
-  // Lip sync: Rapid mouth movement during speech for natural animation
-  // Use 2-frame intervals (0.067s at 30fps) for visible but smooth mouth movement
-  const lipSyncFrameInterval = Math.max(1, Math.floor(fps * 0.067)); // 2 frames at 30fps
-  const lipSyncCycle = Math.floor(frame / lipSyncFrameInterval) % 4; // 4-state cycle
-  // Mouth open for 3 out of 4 states (75%) during speech for more visible animation
-  const isMouthOpen = isSpeaking && (lipSyncCycle !== 1);
-
-  // Blinking: Blink every 2-4 seconds for 0.2 seconds
-  const blinkInterval = fps * 3; // 3 seconds between blinks
-  const blinkDuration = Math.floor(fps * 0.2); // 0.2 second blink
-  const blinkCycleFrame = frame % blinkInterval;
-  const isBlinking = blinkCycleFrame < blinkDuration;
-
-  // Determine which image to display
-  let currentImage = characterImage;
-
-  // Priority: blinking overrides mouth state
-  if (isBlinking && eyeCloseImage) {
-    currentImage = eyeCloseImage;
-  } else if (isMouthOpen && mouthOpenImage) {
-    currentImage = mouthOpenImage;
-  }
-
-  const position = getPosition();
-  const animationTransform = getAnimationTransform();
-
-  // Flip character horizontally if positioned on the left
-  // (characters face left by default, so flip them to face right)
-  const flipTransform = characterPosition === 'left' ? 'scaleX(-1)' : '';
-
-  // Combine all transforms: position, flip, and animation
-  const baseTransform = position.transform || '';
-  const transforms = [baseTransform, flipTransform, animationTransform].filter(Boolean).join(' ');
-
-  return (
-    <div
-      style={{
-        position: 'absolute',
-        ...position,
-        width: '300px',
-        height: '300px',
-        zIndex: 10,
-        transform: transforms || undefined,
-      }}
-    >
-      <Img
-        src={staticFile(currentImage)}
-        style={{
-          width: '100%',
-          height: '100%',
-          objectFit: 'contain',
-        }}
-      />
-    </div>
-  );
-};
-
-const AudioSubtitleLayer: React.FC<{
-  audioFile: string;
-  subtitle?: string;
-  subtitleColor?: string;
-}> = ({ audioFile, subtitle, subtitleColor }) => {
-  const frame = useCurrentFrame();
-  const { fps } = useVideoConfig();
-
-  // Subtle fade for subtitles only
-  const fadeInDuration = fps * 0.3;
-  const opacity = Math.min(1, frame / fadeInDuration);
-
-  // Stroke color from persona, default defined in constants.py
-  const strokeColor = subtitleColor || '{default_subtitle_color}';
-
-  return (
-    <>
-      <Audio src={staticFile(audioFile)} />
-
-      {subtitle && (
-        <div
-          style={{
-            position: 'absolute',
-            bottom: '30px',
-            left: '50%',
-            transform: 'translateX(-50%)',
-            color: 'white',
-            fontSize: '36px',
-            fontFamily: '"Noto Sans JP", "Noto Sans CJK JP", "Yu Gothic", "Hiragino Sans", "Meiryo", Arial, sans-serif',
-            fontWeight: 'bold',
-            width: '80%',
-            textAlign: 'center',
-            lineHeight: '1.4',
-            opacity,
-            WebkitTextStroke: `1.5px ${strokeColor}`,
-            textShadow: '0 0 10px rgba(0, 0, 0, 0.8)',
-          }}
-        >
-          {subtitle}
-        </div>
-      )}
-    </>
-  );
-};
-
-// BgmAudio component
-const BgmAudio: React.FC<{
-  path: string;
-  volume?: number;
-  fadeInSeconds?: number;
-  fadeOutSeconds?: number;
-  loop?: boolean;
-}> = ({ path, volume = 0.3, fadeInSeconds = 2.0, fadeOutSeconds = 2.0, loop = true }) => {
-  const frame = useCurrentFrame();
-  const { fps, durationInFrames } = useVideoConfig();
-
-  // Calculate fade-in
-  const fadeInFrames = fadeInSeconds * fps;
-  const fadeInProgress = Math.min(1, frame / fadeInFrames);
-
-  // Calculate fade-out
-  const fadeOutFrames = fadeOutSeconds * fps;
-  const fadeOutStartFrame = durationInFrames - fadeOutFrames;
-  const fadeOutProgress = frame >= fadeOutStartFrame
-    ? 1 - Math.min(1, (frame - fadeOutStartFrame) / fadeOutFrames)
-    : 1;
-
-  // Combine fades
-  const currentVolume = volume * fadeInProgress * fadeOutProgress;
-
-  return (
-    <Audio
-      src={staticFile(path)}
-      volume={currentVolume}
-      loop={loop}
-    />
-  );
-};
-
-export const VideoGenerator: React.FC<VideoGeneratorProps> = ({ phrases }) => {
-  const scenes = getScenesWithTiming(phrases);
-  const { fps, durationInFrames } = useVideoConfig();
-  const frame = useCurrentFrame();
-
-  // Get transition configuration from composition data
-  const transitionType = (compositionData as any).transition?.type || 'fade';
-  const transitionDuration = (compositionData as any).transition?.duration_frames || 15;
-  const transitionTiming = (compositionData as any).transition?.timing || 'linear';
-
-  const presentation = getTransitionPresentation(transitionType);
-  const timing = getTransitionTiming(transitionTiming, transitionDuration);
-
-  // Calculate actual transition duration for slide sequences
-  const transitionDurationFrames = timing.getDurationInFrames({ fps });
-
-  // Build slide groups with transition compensation
-  // This ensures slides stay visible for the full duration of their audio
-  const slideGroups = getSlideGroups(scenes, transitionDurationFrames);
-
-  // Get personas configuration
-  const personas = (compositionData as any).personas || [];
-
-  // Helper function to check if a persona is speaking at current frame
-  const isPersonaSpeaking = (personaId: string) => {
-    return scenes.some(
-      (scene) =>
-        scene.personaId === personaId &&
-        frame >= scene.startFrame &&
-        frame < scene.endFrame
-    );
-  };
-
-  // Get background and BGM configuration
-  const background = (compositionData as any).background;
-  const bgm = (compositionData as any).bgm;
-
-  return (
-    <AbsoluteFill style={{ backgroundColor: '#1a1a1a' }}>
-      {/* Background layer - lowest z-index */}
-      <BackgroundLayer
-        type={background?.type}
-        path={background?.path}
-        fit={background?.fit}
-        loopDurationInFrames={background?.loopDurationInFrames || durationInFrames}
-      />
-
-      {/* TransitionSeries for slides */}
-      <TransitionSeries>
-        {slideGroups.map((group, index) => (
-          <React.Fragment key={`slide-${index}`}>
-            <TransitionSeries.Sequence durationInFrames={group.durationFrames}>
-              <SlideLayer slideFile={group.slideFile} />
-            </TransitionSeries.Sequence>
-            {/* Add transition between slides, but not after the last slide */}
-            {index < slideGroups.length - 1 && (
-              <TransitionSeries.Transition
-                presentation={presentation}
-                timing={timing}
-              />
-            )}
-          </React.Fragment>
-        ))}
-      </TransitionSeries>
-
-      {/* Character layers - persistent display for each persona */}
-      {personas.map((persona: any, index: number) => {
-        // Fallback position assignment if not configured
-        const positions = ['left', 'right', 'center'];
-        const fallbackPosition = positions[Math.min(index, positions.length - 1)];
-
-        return (
-          <CharacterLayer
-            key={`character-${persona.id}`}
-            characterImage={persona.character_image}
-            characterPosition={persona.character_position || fallbackPosition}
-            mouthOpenImage={persona.mouth_open_image}
-            eyeCloseImage={persona.eye_close_image}
-            animationStyle={persona.animation_style || 'sway'}
-            isSpeaking={isPersonaSpeaking(persona.id)}
-          />
-        );
-      })}
-
-      {/* Audio and subtitle layer - changes with each phrase */}
-      {scenes.map((scene) => (
-        <Sequence
-          key={scene.id}
-          from={scene.startFrame}
-          durationInFrames={scene.durationFrames}
-        >
-          <AudioSubtitleLayer
-            audioFile={scene.audioFile}
-            subtitle={scene.subtitle}
-            subtitleColor={scene.subtitleColor}
-          />
-        </Sequence>
-      ))}
-
-      {/* BGM audio - plays throughout the video */}
-      {bgm && (
-        <BgmAudio
-          path={bgm.path}
-          volume={bgm.volume}
-          fadeInSeconds={bgm.fade_in_seconds}
-          fadeOutSeconds={bgm.fade_out_seconds}
-          loop={bgm.loop}
-        />
-      )}
-    </AbsoluteFill>
-  );
-};
-
-// Calculate total frames for the composition
-// The total duration includes audio plus ending pause to keep final slide visible.
-export const calculateTotalFrames = (phrases: PhraseData[]): number => {
-  const fps = (compositionData as any).fps || 30;
-  const scenes = getScenesWithTiming(phrases);
-
-  // Return audio duration plus 1 second ending pause
-  // This keeps the final slide visible after audio ends.
-  if (scenes.length === 0) return 0;
-  const endingPauseFrames = fps; // 1.0 second
-  return scenes[scenes.length - 1].endFrame + endingPauseFrames;
-};
-""".replace("{default_subtitle_color}", SubtitleConstants.DEFAULT_COLOR)
+    return _render_video_generator_tsx()
 
 
 def get_root_tsx() -> str:
@@ -628,84 +71,12 @@ def get_root_tsx() -> str:
 
     This component reads composition.json and creates Remotion composition.
     """
-    return """import React from 'react';
-import { Composition } from 'remotion';
-import { VideoGenerator, calculateTotalFrames } from './VideoGenerator';
-import compositionData from '../composition.json';
-
-// Inject global styles for font loading
-const styles = `
-  @font-face {
-    font-family: 'Noto Sans JP';
-    src: local('Noto Sans JP'), local('Noto Sans CJK JP');
-    font-display: swap;
-  }
-`;
-
-export const RemotionRoot: React.FC = () => {
-  const totalFrames = calculateTotalFrames(compositionData.phrases);
-
-  return (
-    <>
-      <style>{styles}</style>
-      <Composition
-        id="VideoGenerator"
-        component={VideoGenerator}
-        durationInFrames={totalFrames}
-        fps={compositionData.fps}
-        width={compositionData.width}
-        height={compositionData.height}
-        defaultProps={{
-          phrases: compositionData.phrases
-        }}
-      />
-    </>
-  );
-};
-"""
-    return """import React from 'react';
-import { Composition } from 'remotion';
-import { VideoGenerator, calculateTotalFrames } from './VideoGenerator';
-import compositionData from '../composition.json';
-
-export const RemotionRoot: React.FC = () => {
-  const totalFrames = calculateTotalFrames(compositionData.phrases);
-
-  return (
-    <>
-      <Composition
-        id="VideoGenerator"
-        component={VideoGenerator}
-        durationInFrames={totalFrames}
-        fps={compositionData.fps}
-        width={compositionData.width}
-        height={compositionData.height}
-        defaultProps={{
-          phrases: compositionData.phrases
-        }}
-      />
-    </>
-  );
-};
-"""
+    return _load_template("Root.tsx")
 
 
 def get_remotion_config_ts() -> str:
     """Generate remotion.config.ts template."""
-    return """import { Config } from '@remotion/cli/config';
-
-Config.setVideoImageFormat('jpeg');
-Config.setOverwriteOutput(true);
-Config.setDelayRenderTimeoutInMilliseconds(120000); // 2 minutes timeout
-
-// Encoding settings for better compatibility and seeking
-Config.setCodec('h264');
-Config.setPixelFormat('yuv420p'); // Widely compatible pixel format
-Config.setCrf(23); // Quality setting: 23 is good balance (lower = higher quality, 18 = very high, 28 = medium)
-
-// Ensure fonts are available for rendering
-Config.setChromiumOpenGlRenderer('egl');
-"""
+    return _load_template("remotion.config.ts")
 
 
 def get_package_json(project_name: str) -> dict[str, Any]:
@@ -736,13 +107,21 @@ def get_package_json(project_name: str) -> dict[str, Any]:
     }
 
 
+def get_package_json_str(project_name: str) -> str:
+    """Generate package.json content serialized with 2-space indentation.
+
+    Args:
+        project_name: Name of the project (used for package name)
+
+    Returns:
+        package.json content
+    """
+    return json.dumps(get_package_json(project_name), indent=2)
+
+
 def get_index_ts() -> str:
     """Generate index.ts entry point."""
-    return """import { registerRoot } from 'remotion';
-import { RemotionRoot } from './Root';
-
-registerRoot(RemotionRoot);
-"""
+    return _load_template("index.ts")
 
 
 def get_tsconfig_json() -> dict[str, Any]:
@@ -764,3 +143,9 @@ def get_tsconfig_json() -> dict[str, Any]:
         "include": ["src/**/*"],
         "exclude": ["node_modules"],
     }
+
+
+@functools.cache
+def get_tsconfig_json_str() -> str:
+    """Generate tsconfig.json content serialized with 2-space indentation."""
+    return json.dumps(get_tsconfig_json(), indent=2)
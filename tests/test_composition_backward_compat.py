@@ -5,6 +5,7 @@ maintaining compatibility with Remotion components that handle missing fields.
 """
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -204,3 +205,135 @@ def test_composition_without_background_and_bgm():
             assert "text" in phrase
             assert "duration" in phrase
             assert "audioFile" in phrase
+
+
+def test_streamed_composition_matches_built_data():
+    """Test that the streamed composition.json equals build_composition_data output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        remotion_root = Path(tmpdir)
+
+        phrases = [
+            Phrase(text="こんにちは", persona_id="alice", duration=1.0, start_time=0.0),
+            Phrase(text="World", duration=2.0, start_time=1.0),
+        ]
+        for i, p in enumerate(phrases):
+            p.original_index = i
+            p.section_index = i
+
+        audio_paths = [Path("audio/phrase_0000.wav"), Path("audio/phrase_0001.wav")]
+        slide_paths = [Path("slides/ja/slide_0000.png"), Path("slides/ja/slide_0001.png")]
+        personas = [{"id": "alice", "name": "Alice", "subtitle_color": "#FF0000"}]
+        transition = {"type": "fade", "duration_frames": 15, "timing": "linear"}
+
+        update_composition_json(
+            remotion_root=remotion_root,
+            phrases=phrases,
+            audio_paths=audio_paths,
+            slide_paths=slide_paths,
+            project_name="test",
+            transition=transition,
+            personas=personas,
+        )
+
+        config = CompositionConfig(
+            phrases=phrases,
+            audio_paths=audio_paths,
+            slide_paths=slide_paths,
+            project_name="test",
+            transition=transition,
+            personas=personas,
+        )
+        with (remotion_root / "composition.json").open(encoding="utf-8") as f:
+            assert json.load(f) == build_composition_data(config, remotion_root)
+
+
+def test_unchanged_composition_is_not_rewritten():
+    """Test that identical composition content leaves composition.json untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        remotion_root = Path(tmpdir)
+        phrases = [Phrase(text="Hello", duration=1.0)]
+        kwargs = {
+            "remotion_root": remotion_root,
+            "phrases": phrases,
+            "audio_paths": [Path("audio/phrase_0000.wav")],
+            "slide_paths": None,
+            "project_name": "test",
+        }
+
+        update_composition_json(**kwargs)
+        composition_path = remotion_root / "composition.json"
+        os.utime(composition_path, ns=(0, 0))
+
+        update_composition_json(**kwargs)
+        assert composition_path.stat().st_mtime_ns == 0
+
+        phrases[0].text = "Changed"
+        update_composition_json(**kwargs)
+        assert composition_path.stat().st_mtime_ns != 0
+        assert json.loads(composition_path.read_bytes())["phrases"][0]["text"] == "Changed"
+        assert [p.name for p in remotion_root.iterdir()] == ["composition.json"]
+
+
+def test_phrase_entries_match_composition_phrase_model():
+    """Test phrase entries keep the CompositionPhrase key names and order."""
+    from movie_generator.video.renderer import CompositionPhrase
+
+    phrases = [
+        Phrase(text="Has persona", persona_id="alice", duration=1.0, start_time=0.0),
+        Phrase(text="No persona", duration=2.0, start_time=1.0),
+    ]
+    for i, p in enumerate(phrases):
+        p.original_index = i
+        p.section_index = 0
+    config = CompositionConfig(
+        phrases=phrases,
+        audio_paths=[Path("audio/phrase_0000.wav"), Path("audio/phrase_0001.wav")],
+        slide_paths=[Path("slides/slide_0000.png")],
+        personas=[{"id": "alice", "name": "Alice", "subtitle_color": "#FF0000"}],
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        entries = build_composition_data(config, Path(tmpdir))["phrases"]
+
+    expected = CompositionPhrase(
+        text="Has persona",
+        duration=1.0,
+        start_time=0.0,
+        audioFile="audio/phrase_0000.wav",
+        slideFile="slides/slide_0000.png",
+        persona_id="alice",
+        persona_name="Alice",
+        subtitle_color="#FF0000",
+        character_position="left",
+    ).model_dump(exclude_none=True, by_alias=True)
+    assert list(entries[0].items()) == list(expected.items())
+    assert list(entries[1]) == ["text", "duration", "start_time", "audioFile", "slideFile"]
+
+
+def test_section_background_copied_once_per_section():
+    """Test phrases sharing a section reuse one converted background override."""
+    from unittest.mock import patch
+
+    phrases = [Phrase(text=f"p{i}", duration=1.0, start_time=float(i)) for i in range(3)]
+    for i, p in enumerate(phrases):
+        p.original_index = i
+        p.section_index = 0
+    config = CompositionConfig(
+        phrases=phrases,
+        audio_paths=[],
+        section_backgrounds={0: {"type": "image", "path": "assets/bg.png"}},
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as tmpdir,
+        patch(
+            "movie_generator.video.remotion_renderer._copy_asset_to_public",
+            return_value="backgrounds/bg.png",
+        ) as mock_copy,
+    ):
+        entries = build_composition_data(config, Path(tmpdir))["phrases"]
+
+    mock_copy.assert_called_once()
+    assert all(
+        e["backgroundOverride"] == {"type": "image", "path": "backgrounds/bg.png"} for e in entries
+    )
@@ -94,7 +94,7 @@ class TestRemotionSetupStages:
         mock_templates.get_root_tsx.return_value = "// Root.tsx"
         mock_templates.get_index_ts.return_value = "// index.ts"
         mock_templates.get_remotion_config_ts.return_value = "// remotion.config.ts"
-        mock_templates.get_tsconfig_json.return_value = {"compilerOptions": {}}
+        mock_templates.get_tsconfig_json_str.return_value = '{"compilerOptions": {}}'
 
         # Execute component generation
         mock_project._generate_typescript_components(remotion_dir)
@@ -118,7 +118,7 @@ class TestRemotionSetupStages:
         mock_templates.get_root_tsx.return_value = "// Root.tsx"
         mock_templates.get_index_ts.return_value = "// index.ts"
         mock_templates.get_remotion_config_ts.return_value = "// remotion.config.ts"
-        mock_templates.get_tsconfig_json.return_value = {"compilerOptions": {}}
+        mock_templates.get_tsconfig_json_str.return_value = '{"compilerOptions": {}}'
 
         # Make src directory read-only to cause write failure
         src_dir = remotion_dir / "src"
@@ -312,7 +312,7 @@ class TestRemotionSetupStages:
         mock_templates.get_root_tsx.return_value = "// Root.tsx"
         mock_templates.get_index_ts.return_value = "// index.ts"
         mock_templates.get_remotion_config_ts.return_value = "// remotion.config.ts"
-        mock_templates.get_tsconfig_json.return_value = {"compilerOptions": {}}
+        mock_templates.get_tsconfig_json_str.return_value = '{"compilerOptions": {}}'
 
         # Mock pnpm create success - create the directory structure
         def mock_pnpm_create(*args, **kwargs):
@@ -373,6 +373,34 @@ class TestRemotionSetupStages:
         with pytest.raises(RuntimeError, match="Remotion initialization failed"):
             mock_project.setup_remotion_project()
 
+    def test_copy_character_assets_skips_unchanged_source(self, mock_project, tmp_path):
+        """Test character assets are not re-copied when the source is unchanged."""
+        source_root = tmp_path / "source"
+        character_dir = source_root / "assets" / "characters" / "zundamon"
+        character_dir.mkdir(parents=True)
+        (character_dir / "base.png").write_bytes(b"png")
+
+        mock_project.copy_character_assets(source_root=source_root)
+        assert (mock_project.characters_dir / "zundamon" / "base.png").exists()
+
+        with patch("movie_generator.project.shutil.copy2") as mock_copy:
+            (mock_project.characters_dir / "zundamon" / "base.png").unlink()
+            mock_project.copy_character_assets(source_root=source_root)
+            mock_copy.assert_not_called()
+
+            # Adding a source asset invalidates the signature
+            (character_dir / "mouth_open.png").write_bytes(b"png")
+            mock_project.copy_character_assets(source_root=source_root)
+            assert mock_copy.call_count == 2
+
+        # A modified source asset never overwrites the project's existing copy
+        (mock_project.characters_dir / "zundamon" / "base.png").write_bytes(b"custom png")
+        (character_dir / "base.png").write_bytes(b"updated png")
+        mock_project.copy_character_assets(source_root=source_root)
+        assert (mock_project.characters_dir / "zundamon" / "base.png").read_bytes() == (
+            b"custom png"
+        )
+
 
 class TestRenderingEnvironmentSetup:
     """Test centralized rendering environment setup functions."""
@@ -408,9 +436,67 @@ class TestRenderingEnvironmentSetup:
         # Verify pnpm install was called
         mock_run.assert_called_once()
         call_args = mock_run.call_args
-        assert call_args[0][0] == ["pnpm", "install"]
+        assert call_args[0][0] == ["pnpm", "install", "--prefer-offline"]
         assert call_args[1]["cwd"] == remotion_root
 
+    @patch("movie_generator.video.remotion_renderer.subprocess.run")
+    def test_ensure_pnpm_dependencies_cached_after_install(self, mock_run, remotion_root):
+        """Test pnpm install is not repeated for a root already confirmed."""
+        mock_run.return_value = Mock(returncode=0, stderr="")
+
+        ensure_pnpm_dependencies(remotion_root)
+        ensure_pnpm_dependencies(remotion_root)
+
+        mock_run.assert_called_once()
+
+    @patch("movie_generator.video.remotion_renderer.subprocess.run")
+    def test_ensure_pnpm_dependencies_marker_tracks_lockfile(self, mock_run, remotion_root):
+        """Test the node_modules marker skips reinstall until the lockfile changes."""
+        import os
+
+        from movie_generator.video import remotion_renderer
+
+        mock_run.return_value = Mock(returncode=0, stderr="")
+        (remotion_root / "node_modules").mkdir()
+        lockfile = remotion_root / "pnpm-lock.yaml"
+        lockfile.write_text("lockfileVersion: '9.0'\n")
+
+        ensure_pnpm_dependencies(remotion_root)
+        marker = remotion_root / "node_modules" / remotion_renderer.DEPS_MARKER_FILENAME
+        assert marker.exists()
+
+        # A fresh process trusts the matching marker
+        remotion_renderer._DEPS_READY_ROOTS.clear()
+        ensure_pnpm_dependencies(remotion_root)
+        mock_run.assert_not_called()
+
+        # Lockfile changed since the marker was written: reinstall
+        remotion_renderer._DEPS_READY_ROOTS.clear()
+        os.utime(lockfile, ns=(0, 0))
+        ensure_pnpm_dependencies(remotion_root)
+        mock_run.assert_called_once()
+
+    @patch("movie_generator.video.remotion_renderer.subprocess.run")
+    def test_ensure_pnpm_dependencies_marker_records_lockfile_written_by_install(
+        self, mock_run, remotion_root
+    ):
+        """Test a lockfile created by pnpm install does not invalidate the new marker."""
+        from movie_generator.video import remotion_renderer
+
+        def fake_install(*args, **kwargs):
+            (remotion_root / "node_modules").mkdir(exist_ok=True)
+            (remotion_root / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n")
+            return Mock(returncode=0, stderr="")
+
+        mock_run.side_effect = fake_install
+
+        ensure_pnpm_dependencies(remotion_root)
+
+        # A fresh process finds a marker matching the lockfile pnpm wrote
+        remotion_renderer._DEPS_READY_ROOTS.clear()
+        ensure_pnpm_dependencies(remotion_root)
+        mock_run.assert_called_once()
+
     @patch("movie_generator.video.remotion_renderer.subprocess.run")
     def test_ensure_pnpm_dependencies_install_failure(self, mock_run, remotion_root):
         """Test pnpm dependency installation failure."""
@@ -423,6 +509,39 @@ class TestRenderingEnvironmentSetup:
         with pytest.raises(RenderingError, match="pnpm install failed"):
             ensure_pnpm_dependencies(remotion_root)
 
+    def test_ensure_pnpm_dependencies_locks_per_root(self, tmp_path):
+        """Test an install in one root does not block another root."""
+        import threading
+
+        slow_root = tmp_path / "slow"
+        fast_root = tmp_path / "fast"
+        slow_root.mkdir()
+        (fast_root / "node_modules").mkdir(parents=True)
+        install_started = threading.Event()
+        release_install = threading.Event()
+
+        def blocking_install(*args, **kwargs):
+            install_started.set()
+            release_install.wait(timeout=10)
+            return Mock(returncode=0, stderr="")
+
+        with patch(
+            "movie_generator.video.remotion_renderer.subprocess.run",
+            side_effect=blocking_install,
+        ):
+            slow = threading.Thread(target=ensure_pnpm_dependencies, args=(slow_root,))
+            slow.start()
+            try:
+                assert install_started.wait(timeout=5)
+                fast = threading.Thread(target=ensure_pnpm_dependencies, args=(fast_root,))
+                fast.start()
+                fast.join(timeout=2)
+                # Finished while the slow root's install is still running
+                assert not fast.is_alive()
+            finally:
+                release_install.set()
+                slow.join(timeout=10)
+
     @patch("movie_generator.video.remotion_renderer.ProjectPaths")
     def test_ensure_chrome_headless_shell_already_exists(self, mock_paths, remotion_root):
         """Test Chrome Headless Shell check when already downloaded."""
@@ -437,6 +556,25 @@ class TestRenderingEnvironmentSetup:
         # Verify no download was attempted (function returns early)
         # If no exception is raised, the test passes
 
+    @patch("movie_generator.video.remotion_renderer.ProjectPaths")
+    def test_ensure_chrome_headless_shell_relinks_dangling_symlink(
+        self, mock_paths, remotion_root, tmp_path
+    ):
+        """Test a symlink to an evicted global cache is recreated."""
+        project_root = tmp_path / "project"
+        mock_paths.get_project_root.return_value = project_root
+        global_cache = project_root / ".cache" / "remotion" / "chrome-headless-shell"
+        global_cache.mkdir(parents=True)
+
+        browser_path = remotion_root / "node_modules" / ".remotion" / "chrome-headless-shell"
+        browser_path.parent.mkdir(parents=True)
+        browser_path.symlink_to(tmp_path / "evicted", target_is_directory=True)
+
+        ensure_chrome_headless_shell(remotion_root)
+
+        assert browser_path.is_symlink()
+        assert browser_path.resolve() == global_cache.resolve()
+
     @patch("shutil.move")
     @patch("movie_generator.video.remotion_renderer.subprocess.run")
     @patch("movie_generator.video.remotion_renderer.ProjectPaths")
@@ -472,6 +610,34 @@ class TestRenderingEnvironmentSetup:
         # Verify download commands were called
         assert mock_run.call_count >= 2  # pnpm install + remotion browser ensure
 
+    @patch("movie_generator.video.remotion_renderer.subprocess.run")
+    @patch("movie_generator.video.remotion_renderer.ProjectPaths")
+    def test_ensure_chrome_headless_shell_uses_project_cli(
+        self, mock_paths, mock_run, remotion_root, tmp_path
+    ):
+        """Test the browser is fetched with the project's Remotion CLI, no temp install."""
+        project_root = tmp_path / "project"
+        mock_paths.get_project_root.return_value = project_root
+        local_cli = remotion_root / "node_modules" / ".bin" / "remotion"
+        local_cli.parent.mkdir(parents=True)
+        local_cli.touch()
+        browser_path = remotion_root / "node_modules" / ".remotion" / "chrome-headless-shell"
+
+        def browser_ensure(*args, **kwargs):
+            browser_path.mkdir(parents=True)
+            return Mock(returncode=0)
+
+        mock_run.side_effect = browser_ensure
+
+        ensure_chrome_headless_shell(remotion_root)
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [str(local_cli), "browser", "ensure"]
+        global_cache = project_root / ".cache" / "remotion" / "chrome-headless-shell"
+        assert global_cache.is_dir()
+        assert browser_path.resolve() == global_cache.resolve()
+        assert not (project_root / ".cache" / "remotion" / "_temp_download").exists()
+
     @patch("movie_generator.video.remotion_renderer.ensure_pnpm_dependencies")
     @patch("movie_generator.video.remotion_renderer.ensure_chrome_headless_shell")
     @patch("movie_generator.video.remotion_renderer.ProjectPaths")
@@ -516,3 +682,17 @@ class TestRenderingEnvironmentSetup:
         # Verify setup functions were called but no new symlink created
         mock_pnpm.assert_called_once()
         mock_chrome.assert_called_once()
+
+    @patch("movie_generator.video.remotion_renderer.ensure_pnpm_dependencies")
+    @patch("movie_generator.video.remotion_renderer.ensure_chrome_headless_shell")
+    def test_ensure_rendering_environment_cached_per_root(
+        self, mock_chrome, mock_pnpm, remotion_root
+    ):
+        """Test environment checks run only once per remotion_root."""
+        (remotion_root.parent / "assets").mkdir()
+
+        ensure_rendering_environment(remotion_root)
+        ensure_rendering_environment(remotion_root)
+
+        mock_pnpm.assert_called_once_with(remotion_root)
+        mock_chrome.assert_called_once_with(remotion_root)
@@ -0,0 +1,25 @@
+"""Tests for JSON serialization utilities."""
+
+import json
+
+from movie_generator.utils import serialization
+from movie_generator.utils.serialization import dumps_json_bytes
+
+
+def test_dumps_json_bytes_round_trip():
+    """Test serialized bytes decode back to the original data."""
+    data = {"title": "テスト", "phrases": [{"text": "こんにちは", "duration": 1.5}]}
+
+    result = dumps_json_bytes(data)
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == data
+
+
+def test_dumps_json_bytes_without_orjson(monkeypatch):
+    """Test stdlib fallback emits compact, non-ASCII-escaped JSON."""
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    result = dumps_json_bytes({"text": "ずんだもん", "n": 1})
+
+    assert result == '{"text":"ずんだもん","n":1}'.encode()
@@ -0,0 +1,61 @@
+"""Unit tests for subprocess utility."""
+
+import subprocess
+import sys
+
+import pytest
+
+from movie_generator.utils.subprocess import make_command_runner, run_command_safely
+
+
+class TestRunCommandSafely:
+    """Test run_command_safely utility."""
+
+    def test_captures_bytes_by_default(self):
+        """Test that output is not decoded unless text=True."""
+        result = run_command_safely([sys.executable, "-c", "print('ok')"])
+        assert result.stdout.strip() == b"ok"
+
+    def test_text_output(self):
+        """Test that text=True decodes output."""
+        result = run_command_safely([sys.executable, "-c", "print('ok')"], text=True)
+        assert result.stdout.strip() == "ok"
+
+    def test_error_message_decodes_stderr(self):
+        """Test that stderr is decoded into the custom error message."""
+        script = "import sys; sys.stderr.write('ずんだ failed'); sys.exit(1)"
+        with pytest.raises(RuntimeError, match="Step failed\nずんだ failed"):
+            run_command_safely([sys.executable, "-c", script], error_message="Step failed")
+
+    def test_failure_without_error_message(self):
+        """Test that CalledProcessError propagates without a custom message."""
+        with pytest.raises(subprocess.CalledProcessError):
+            run_command_safely([sys.executable, "-c", "raise SystemExit(2)"])
+
+    def test_missing_command(self):
+        """Test that a missing executable raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="not installed or not available in PATH"):
+            run_command_safely(["definitely-not-a-real-command-xyz"])
+
+
+class TestMakeCommandRunner:
+    """Test make_command_runner utility."""
+
+    def test_runner_binds_cwd(self, tmp_path):
+        """Test that the bound working directory is used for every call."""
+        run = make_command_runner(cwd=tmp_path, text=True)
+        result = run([sys.executable, "-c", "import os; print(os.getcwd())"])
+        assert result.stdout.strip() == str(tmp_path)
+
+    def test_runner_error_message(self):
+        """Test that the bound error message prefixes decoded stderr."""
+        run = make_command_runner(error_message="Step failed")
+        script = "import sys; sys.stderr.write('boom'); sys.exit(1)"
+        with pytest.raises(RuntimeError, match="Step failed\nboom"):
+            run([sys.executable, "-c", script])
+
+    def test_runner_missing_command(self):
+        """Test that a missing executable raises RuntimeError."""
+        run = make_command_runner()
+        with pytest.raises(RuntimeError, match="not installed or not available in PATH"):
+            run(["definitely-not-a-real-command-xyz"])
@@ -1,5 +1,12 @@
 """Tests for TypeScript template generation with transitions."""
 
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+
 from movie_generator.video.templates import get_video_generator_tsx
 
 
@@ -66,10 +73,10 @@ def test_calculate_total_frames_uses_audio_duration():
     """Test that calculateTotalFrames uses audio duration for complete playback."""
     template = get_video_generator_tsx()
 
-    # Check that the function uses the last scene's end frame (audio duration)
+    # Check that the function uses the last phrase's end frame (audio duration)
     # This ensures all audio plays completely, even when slides overlap during transitions
-    assert "const scenes = getScenesWithTiming(phrases)" in template
-    assert "return scenes[scenes.length - 1].endFrame" in template
+    assert "const lastPhrase = phrases[phrases.length - 1]" in template
+    assert "return lastEndFrame + endingPauseFrames" in template
     # Verify the comment explains the reasoning
     assert "The total duration includes audio plus ending pause" in template
 
@@ -87,3 +94,224 @@ def test_template_parameters_are_documented():
     assert "transition_type" in params
     assert "transition_duration" in params
     assert "transition_timing" in params
+
+
+def test_video_generator_template_is_cached():
+    """Test that repeated calls reuse the generated template string."""
+    assert get_video_generator_tsx() is get_video_generator_tsx()
+    assert "__DEFAULT_SUBTITLE_COLOR__" not in get_video_generator_tsx()
+
+
+def test_serialized_config_templates_match_json_dumps():
+    """Test that the serialized JSON templates match serializing the dicts."""
+    from movie_generator.video.templates import (
+        get_package_json,
+        get_package_json_str,
+        get_tsconfig_json,
+        get_tsconfig_json_str,
+    )
+
+    assert get_tsconfig_json_str() == json.dumps(get_tsconfig_json(), indent=2)
+    for name in ("demo", 'quote"and\\slash', "日本語"):
+        assert json.loads(get_package_json_str(name)) == get_package_json(name)
+
+
+def _without_whitespace(text: str) -> str:
+    return re.sub(r"\s+", "", text)
+
+
+def test_template_keeps_per_frame_work_out_of_render():
+    """Test that per-frame state comes from memoized lookups instead of recomputation."""
+    template = _without_whitespace(get_video_generator_tsx())
+
+    for snippet in [
+        # Speaking state, slide children and transitions are built once per input
+        "React.useMemo(() => getSpeakingIntervals(scenes), [scenes])",
+        "isFrameInIntervals(speakingIntervals.get(personaId), frame)",
+        "<TransitionSeries>{slideChildren}</TransitionSeries>",
+        "}, [slideGroups, presentation, timing]);",
+        "React.useMemo(() => getTransitionPresentation(transitionType), [transitionType])",
+        "React.useMemo(() => getTransitionTiming(transitionTiming, transitionDuration),"
+        "[transitionTiming, transitionDuration])",
+        # Lip sync, blinking and sway read precomputed tables
+        "React.useMemo(() => getAnimationStateTable(fps), [fps])",
+        "animationStateTable[frame % animationStateTable.length]",
+        "swayTable[frame % swayTable.length]",
+        # Layers that do not depend on the frame skip re-rendering
+        "const BackgroundLayer = React.memo<",
+        "const SlideLayer = React.memo<",
+        "const CharacterLayer = React.memo<",
+        "const BgmAudio = React.memo<",
+        "interpolate(frame, [0, fadeInDuration], [0, 1], CLAMP)",
+    ]:
+        assert _without_whitespace(snippet) in template, snippet
+
+    # Only VideoGenerator reads the video config; leaves receive fps as props
+    assert template.count("useVideoConfig()") == 1
+    for snippet in ["scenes.some(", "phrases.slice(0, index)", "React.Fragment"]:
+        assert _without_whitespace(snippet) not in template, snippet
+
+
+# Pure helpers of VideoGenerator.tsx exercised under node
+_NODE_HELPERS = [
+    "getScenesWithTiming",
+    "getSlideGroups",
+    "getSpeakingIntervals",
+    "isFrameInIntervals",
+    "MOUTH_OPEN_FLAG",
+    "BLINKING_FLAG",
+    "getAnimationState",
+    "greatestCommonDivisor",
+    "getAnimationStateTable",
+    "getSwayTable",
+]
+
+
+def _extract_helper(template: str, name: str) -> str:
+    """Return the top-level `const <name> = ...` declaration from the template."""
+    lines = template.splitlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith(f"const {name} = "))
+    block = [lines[start]]
+    for line in lines[start + 1 :]:
+        if line.startswith("}"):
+            block.append(line)
+            break
+        if line and not line[0].isspace() and not line.startswith(")"):
+            break
+        block.append(line)
+    return "\n".join(block)
+
+
+def _strip_types(source: str) -> str:
+    """Strip the TypeScript annotations used by the helpers so node can run them."""
+    source = re.sub(r"\s+as\s+(?:any|const)\b", "", source)
+    source = re.sub(r"new (\w+)<[^()]*?>\(", r"new \1(", source)
+    source = re.sub(r"\b((?:const|let)\s+\w+)\s*:[^=]*?=", r"\1 =", source)
+
+    def strip_params(match: re.Match[str]) -> str:
+        return "= (" + re.sub(r":\s*[^,=]+", "", match.group(1)) + ") =>"
+
+    return re.sub(r"=\s*\(([^()]*)\)\s*(?::[^=]+?)?\s*=>", strip_params, source)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_template_helpers_execute_under_node(tmp_path):
+    """Test scene timing, slide grouping, speaking intervals and lookup tables by running them."""
+    template = get_video_generator_tsx()
+    phrases = [
+        {
+            "text": "a",
+            "duration": 1.0,
+            "start_time": 0.0,
+            "audioFile": "a.wav",
+            "slideFile": "s1.png",
+            "personaId": "p1",
+        },
+        {
+            "text": "b",
+            "duration": 0.5,
+            "start_time": 1.0,
+            "audioFile": "b.wav",
+            "slideFile": "s1.png",
+            "personaId": "p2",
+        },
+        {
+            "text": "c",
+            "duration": 1.0,
+            "start_time": 1.5,
+            "audioFile": "c.wav",
+            "slideFile": "s2.png",
+            "personaId": "p1",
+        },
+        {
+            "text": "c2",
+            "duration": 0.5,
+            "start_time": 1.5,
+            "audioFile": "c.wav",
+            "slideFile": "s2.png",
+            "personaId": "p1",
+        },
+        {
+            "text": "d",
+            "duration": 1.0,
+            "start_time": 3.0,
+            "audioFile": "",
+            "slideFile": "s3.png",
+            "personaId": "p2",
+        },
+        {
+            "text": "e",
+            "duration": 0.2,
+            "start_time": 4.0,
+            "audioFile": "e.wav",
+            "slideFile": "s3.png",
+        },
+    ]
+    driver = """
+const scenes = getScenesWithTiming(phrases);
+const intervals = getSpeakingIntervals(scenes);
+const speaking = {};
+for (const personaId of ['p1', 'p2', 'p3']) {
+  speaking[personaId] = [];
+  for (let frame = 0; frame < 130; frame++) {
+    speaking[personaId].push(isFrameInIntervals(intervals.get(personaId), frame));
+  }
+}
+const tableMismatches = {};
+for (const fps of [24, 25, 30, 60]) {
+  const animationTable = getAnimationStateTable(fps);
+  const swayTable = getSwayTable(fps);
+  let mismatches = 0;
+  for (let frame = 0; frame < fps * 20; frame++) {
+    if (animationTable[frame % animationTable.length] !== getAnimationState(frame, fps)) {
+      mismatches++;
+    }
+    const sway = Math.sin((frame / fps) * Math.PI) * 5;
+    if (Math.abs(swayTable[frame % swayTable.length] - sway) > 1e-9) mismatches++;
+  }
+  tableMismatches[fps] = mismatches;
+}
+console.log(JSON.stringify({
+  scenes: scenes.map((s) => [s.id, s.startFrame, s.endFrame]),
+  groups: getSlideGroups(scenes, 10).map((g) => [g.slideFile, g.scenes.length, g.durationFrames]),
+  speaking,
+  tableMismatches,
+  nonIntegerFps: [getAnimationStateTable(29.97), getSwayTable(29.97)],
+}));
+"""
+    script = tmp_path / "helpers.js"
+    script.write_text(
+        "const compositionData = { fps: 30 };\n"
+        + f"const phrases = {json.dumps(phrases)};\n"
+        + "\n".join(_strip_types(_extract_helper(template, name)) for name in _NODE_HELPERS)
+        + driver,
+        encoding="utf-8",
+    )
+
+    result = subprocess.run(
+        ["node", str(script)], capture_output=True, text=True, check=True, timeout=60
+    )
+    output = json.loads(result.stdout)
+
+    # Content-based keys; duplicates are disambiguated by index
+    assert output["scenes"] == [
+        ["a.wav@0", 0, 30],
+        ["b.wav@30", 30, 45],
+        ["c.wav@45", 45, 75],
+        ["c.wav@45#3", 45, 60],
+        ["phrase-4", 90, 120],
+        ["e.wav@120", 120, 126],
+    ]
+    # Non-final slides run to the next slide's start plus the transition; the
+    # last one runs to its final scene's end plus a one second ending pause
+    assert output["groups"] == [["s1.png", 2, 55], ["s2.png", 2, 55], ["s3.png", 2, 66]]
+    for persona_id in ("p1", "p2", "p3"):
+        ranges = [
+            (start, end)
+            for (_, start, end), phrase in zip(output["scenes"], phrases, strict=True)
+            if phrase.get("personaId") == persona_id
+        ]
+        expected = [any(start <= frame < end for start, end in ranges) for frame in range(130)]
+        assert output["speaking"][persona_id] == expected, persona_id
+    assert output["tableMismatches"] == {"24": 0, "25": 0, "30": 0, "60": 0}
+    assert output["nonIntegerFps"] == [None, None]
@@ -1,14 +1,28 @@
 """End-to-end tests for video generation with Remotion."""
 
+import shutil
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from movie_generator.script.phrases import Phrase
 from movie_generator.video.remotion_renderer import (
+    RENDER_OUTPUT_BUFFER_SIZE,
+    _build_render_command,
+    _build_slide_map,
+    _copy_asset_to_public,
+    _fast_copy,
+    _get_slide_file_path,
+    _get_video_duration_frames,
+    _render_in_chunks,
+    _run_with_output_tail_async,
+    _split_frame_ranges,
     create_remotion_input,
     render_video_with_remotion,
+    render_video_with_remotion_async,
 )
 from movie_generator.video.renderer import CompositionConfig, RenderConfig
 
@@ -54,6 +68,495 @@ def test_create_remotion_input_without_slides():
     assert "slideFile" not in result[0]
 
 
+def test_build_slide_map():
+    """Test slide map parses section indices and language subdirectories."""
+    slide_paths = [
+        Path("project/slides/ja/slide_0000.png"),
+        Path("project/slides/slide_0002.png"),
+        Path("project/slides/ja/cover.png"),
+    ]
+
+    slide_map = _build_slide_map(slide_paths)
+
+    assert slide_map == {0: "slides/ja/slide_0000.png", 2: "slides/slide_0002.png"}
+    # Returned maps are independent copies of the memoized result
+    slide_map[5] = "mutated"
+    assert 5 not in _build_slide_map(slide_paths)
+    assert _get_slide_file_path(slide_paths, 2) == "slides/slide_0002.png"
+    assert _get_slide_file_path(slide_paths, 1) == ""
+
+
+def test_video_duration_probe_is_memoized(tmp_path):
+    """Test an unchanged file is probed with ffprobe only once."""
+    video = tmp_path / "bg.mp4"
+    video.write_bytes(b"video")
+
+    with patch(
+        "movie_generator.video.remotion_renderer.subprocess.run",
+        return_value=Mock(stdout="2.5\n"),
+    ) as mock_run:
+        assert _get_video_duration_frames(video, fps=30) == 75
+        assert _get_video_duration_frames(video, fps=60) == 150
+
+    mock_run.assert_called_once()
+
+
+def test_fast_copy_replaces_destination_without_writing_through(tmp_path):
+    """Test _fast_copy links or copies src and never modifies an existing dst inode."""
+    src = tmp_path / "bg.png"
+    src.write_bytes(b"new")
+    other = tmp_path / "other.png"
+    other.write_bytes(b"old")
+    dst = tmp_path / "public" / "bg.png"
+    dst.parent.mkdir()
+    dst.hardlink_to(other)
+
+    _fast_copy(src, dst)
+    _fast_copy(src, dst)  # already the same file: no-op
+
+    assert dst.read_bytes() == b"new"
+    assert other.read_bytes() == b"old"
+
+
+def test_copy_asset_to_public_skips_up_to_date_destination(tmp_path):
+    """Test an asset already placed by a previous render is not copied again."""
+    import os
+
+    asset = tmp_path / "bg.png"
+    asset.write_bytes(b"image")
+    remotion_root = tmp_path / "remotion"
+
+    assert _copy_asset_to_public(asset, remotion_root, "backgrounds") == "backgrounds/bg.png"
+    with patch("movie_generator.video.remotion_renderer._fast_copy") as mock_copy:
+        _copy_asset_to_public(asset, remotion_root, "backgrounds")
+        mock_copy.assert_not_called()
+
+        # A newer, different source is copied again
+        asset.unlink()
+        asset.write_bytes(b"new image")
+        os.utime(asset, ns=(10**19, 10**19))
+        _copy_asset_to_public(asset, remotion_root, "backgrounds")
+        mock_copy.assert_called_once()
+
+
+def test_copy_asset_to_public_remuxes_bgm_in_one_ffmpeg_pass(tmp_path):
+    """Test BGM is copied through a single ffmpeg call without a separate probe."""
+    bgm = tmp_path / "bgm.mp3"
+    bgm.write_bytes(b"audio")
+
+    with patch("movie_generator.video.remotion_renderer.subprocess.run") as mock_run:
+        assert _copy_asset_to_public(bgm, tmp_path / "remotion", "bgm") == "bgm/bgm.mp3"
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args[0][0][0] == "ffmpeg"
+
+
+def test_composition_config_total_frames_uses_fps():
+    """Test total duration/frames derive from the last phrase and configured fps."""
+    phrases = [
+        Phrase(text="First phrase", duration=2.0, start_time=1.0),
+        Phrase(text="Second phrase", duration=3.0, start_time=3.5),
+    ]
+
+    config = CompositionConfig(phrases=phrases, audio_paths=[], fps=60)
+
+    assert config.total_duration == 7.5  # 3.5 + 3.0 + 1.0s ending pause
+    assert config.total_frames == 450
+    assert CompositionConfig(phrases=[], audio_paths=[]).total_frames == 0
+
+    # Duration is derived from the rendered frames, ending pause included
+    odd = CompositionConfig(
+        phrases=[Phrase(text="Odd", duration=1.01, start_time=0.0)], audio_paths=[], fps=30
+    )
+    assert odd.total_frames == 60
+    assert odd.total_duration == 2.0
+
+
+def test_build_render_command_prefers_local_remotion_cli(tmp_path):
+    """Test the project-local Remotion binary is used instead of npx when installed."""
+    render_config = RenderConfig(output_path=tmp_path / "out.mp4", remotion_root=tmp_path)
+
+    command = _build_render_command(render_config, render_config.output_path, concurrency=2)
+    assert command[:3] == ["npx", "remotion", "render"]
+
+    local_cli = tmp_path / "node_modules" / ".bin" / "remotion"
+    local_cli.parent.mkdir(parents=True)
+    local_cli.touch()
+
+    command = _build_render_command(render_config, render_config.output_path, concurrency=2)
+    assert command[:2] == [str(local_cli), "render"]
+
+
+def test_split_frame_ranges_covers_all_frames():
+    """Test frame ranges are contiguous, inclusive, and near-equal in size."""
+    assert _split_frame_ranges(10, 3) == [(0, 2), (3, 5), (6, 9)]
+    assert _split_frame_ranges(4, 4) == [(0, 0), (1, 1), (2, 2), (3, 3)]
+
+
+def _write_wav(path, frames, fps, sample_rate=48000):
+    """Write a silent WAV spanning the given number of video frames."""
+    import wave
+
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\0\0" * (frames * sample_rate // fps))
+
+
+def _fake_chunked_remotion(commands, remotion_frames, fps=30):
+    """Stand in for Remotion and ffmpeg: record commands, write the audio WAV."""
+
+    async def fake_run(command, cwd):
+        commands.append(command)
+        if "--codec=wav" in command:
+            _write_wav(command[command.index("VideoGenerator") + 1], remotion_frames, fps)
+        return 0, ""
+
+    return fake_run
+
+
+@pytest.mark.asyncio
+async def test_render_in_chunks_renders_ranges_and_concatenates(tmp_path):
+    """Test chunked rendering bundles once, renders muted ranges, and muxes one audio track."""
+    render_config = RenderConfig(
+        output_path=tmp_path / "output.mp4",
+        remotion_root=tmp_path,
+        render_concurrency=4,
+        render_chunks=2,
+    )
+    commands = []
+
+    with patch(
+        "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+        side_effect=_fake_chunked_remotion(commands, remotion_frames=100),
+    ):
+        await _render_in_chunks(
+            render_config, render_config.output_path, total_frames=100, fps=30, chunks=2
+        )
+
+    # Bundled exactly once, before any render, and every render uses that bundle
+    remotion_commands, ffmpeg_cmd = commands[:-1], commands[-1]
+    assert [c[2] for c in remotion_commands] == ["bundle", "render", "render", "render"]
+    bundle_dir = commands[0][commands[0].index("--out-dir") + 1]
+    assert all(c[3] == bundle_dir for c in remotion_commands[1:])
+
+    chunk_commands = [c for c in remotion_commands if "--muted" in c]
+    frame_args = sorted(c[-1] for c in chunk_commands)
+    assert frame_args == ["--frames=0-49", "--frames=50-99"]
+    assert all(c[c.index("--concurrency") + 1] == "2" for c in chunk_commands)
+
+    # The audio track is rendered once over the whole composition
+    (audio_command,) = [c for c in remotion_commands if "--codec=wav" in c]
+    assert not any(arg.startswith("--frames") for arg in audio_command)
+
+    assert ffmpeg_cmd[0] == "ffmpeg"
+    audio_path = audio_command[audio_command.index("VideoGenerator") + 1]
+    assert ffmpeg_cmd[ffmpeg_cmd.index("-i", ffmpeg_cmd.index("-i") + 1) + 1] == audio_path
+    assert ffmpeg_cmd[ffmpeg_cmd.index("-c:v") + 1] == "copy"
+    assert ffmpeg_cmd[-1] == str(tmp_path / "output.mp4")
+    # Parts, audio, bundle and concat list live in a work directory that is removed
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("total_frames", "chunks"), [(100, 2), (101, 4), (7, 7), (1000, 3)])
+async def test_render_in_chunks_boundaries_are_contiguous(tmp_path, total_frames, chunks):
+    """Test chunk frame ranges tile the composition with no gaps or overlaps."""
+    render_config = RenderConfig(
+        output_path=tmp_path / "output.mp4",
+        remotion_root=tmp_path,
+        render_chunks=chunks,
+    )
+    commands = []
+
+    with patch(
+        "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+        side_effect=_fake_chunked_remotion(commands, remotion_frames=total_frames),
+    ):
+        await _render_in_chunks(
+            render_config, render_config.output_path, total_frames, fps=30, chunks=chunks
+        )
+
+    ranges = sorted(
+        tuple(int(n) for n in arg.removeprefix("--frames=").split("-"))
+        for c in commands
+        for arg in c
+        if arg.startswith("--frames=")
+    )
+    assert len(ranges) == chunks
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == total_frames - 1
+    for (_, last), (first, _) in zip(ranges, ranges[1:], strict=False):
+        assert first == last + 1
+
+
+@pytest.mark.asyncio
+async def test_render_in_chunks_fails_when_remotion_frame_count_differs(tmp_path):
+    """Test a composition longer than the planned frame ranges fails instead of truncating."""
+    from movie_generator.exceptions import RenderingError
+
+    render_config = RenderConfig(output_path=tmp_path / "output.mp4", remotion_root=tmp_path)
+    commands = []
+
+    with patch(
+        "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+        side_effect=_fake_chunked_remotion(commands, remotion_frames=130),
+    ):
+        with pytest.raises(RenderingError, match="130 frames long, but 100"):
+            await _render_in_chunks(
+                render_config, render_config.output_path, total_frames=100, fps=30, chunks=2
+            )
+
+    assert not any(c[0] == "ffmpeg" for c in commands)
+
+
+@pytest.mark.asyncio
+async def test_render_in_chunks_reports_chunks_when_progress_requested(tmp_path):
+    """Test show_progress explains the missing live output and reports finished chunks."""
+    render_config = RenderConfig(
+        output_path=tmp_path / "output.mp4", remotion_root=tmp_path, show_progress=True
+    )
+
+    with (
+        patch(
+            "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+            side_effect=_fake_chunked_remotion([], remotion_frames=10),
+        ),
+        patch("movie_generator.video.remotion_renderer.console") as mock_console,
+    ):
+        await _render_in_chunks(
+            render_config, render_config.output_path, total_frames=10, fps=30, chunks=2
+        )
+
+    messages = " ".join(str(call.args[0]) for call in mock_console.print.call_args_list)
+    assert "progress is not shown" in messages
+    assert "Rendered frames 0-4" in messages
+    assert "Rendered frames 5-9" in messages
+    assert "Rendered audio" in messages
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg not installed",
+)
+async def test_render_in_chunks_joined_output_has_continuous_audio(tmp_path):
+    """Test the joined video keeps every frame and one uninterrupted audio track."""
+    import json
+    import subprocess
+
+    from movie_generator.video import remotion_renderer
+
+    fps = 30
+    total_frames = 95
+    render_config = RenderConfig(
+        output_path=tmp_path / "output.mp4",
+        remotion_root=tmp_path,
+        render_chunks=3,
+    )
+    run_with_output_tail_async = remotion_renderer._run_with_output_tail_async
+
+    async def fake_remotion(command, cwd):
+        """Stand in for Remotion by producing the requested media with ffmpeg."""
+        if command[0] == "ffmpeg":
+            return await run_with_output_tail_async(command, cwd)
+        if "bundle" in command:
+            Path(command[command.index("--out-dir") + 1]).mkdir()
+            return 0, ""
+        output = command[command.index("VideoGenerator") + 1]
+        if "--codec=wav" in command:
+            source = ["-f", "lavfi", "-i", f"sine=frequency=440:duration={total_frames / fps}"]
+            codec = ["-c:a", "pcm_s16le"]
+        else:
+            frames = next(arg for arg in command if arg.startswith("--frames="))
+            first, last = (int(n) for n in frames.removeprefix("--frames=").split("-"))
+            source = ["-f", "lavfi", "-i", f"testsrc=size=64x64:rate={fps}"]
+            codec = ["-frames:v", str(last - first + 1), "-c:v", "libx264", "-pix_fmt", "yuv420p"]
+        subprocess.run(["ffmpeg", "-y", *source, *codec, output], check=True, capture_output=True)
+        return 0, ""
+
+    with patch(
+        "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+        side_effect=fake_remotion,
+    ):
+        await _render_in_chunks(
+            render_config, render_config.output_path, total_frames, fps=fps, chunks=3
+        )
+
+    probe = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-count_frames",
+            "-show_entries",
+            "stream=codec_type,nb_read_frames,duration",
+            "-of",
+            "json",
+            str(render_config.output_path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    streams = json.loads(probe.stdout)["streams"]
+    video = [st for st in streams if st["codec_type"] == "video"]
+    audio = [st for st in streams if st["codec_type"] == "audio"]
+    assert len(video) == 1
+    assert int(video[0]["nb_read_frames"]) == total_frames
+    assert len(audio) == 1
+    assert float(audio[0]["duration"]) == pytest.approx(total_frames / fps, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_render_in_chunks_failure_raises(tmp_path):
+    """Test a failing chunk raises RenderingError and skips concatenation."""
+    from movie_generator.exceptions import RenderingError
+
+    render_config = RenderConfig(output_path=tmp_path / "output.mp4", remotion_root=tmp_path)
+    commands = []
+
+    async def fail_renders(command, cwd):
+        commands.append(command)
+        return (0, "") if "bundle" in command else (1, "boom")
+
+    with patch(
+        "movie_generator.video.remotion_renderer._run_with_output_tail_async",
+        side_effect=fail_renders,
+    ):
+        with pytest.raises(RenderingError):
+            await _render_in_chunks(
+                render_config, render_config.output_path, total_frames=10, fps=30, chunks=2
+            )
+
+    assert not any(c[0] == "ffmpeg" for c in commands)
+
+
+@pytest.mark.asyncio
+async def test_run_with_output_tail_async_keeps_last_lines(tmp_path):
+    """Test the asyncio variant keeps the same bounded output tail."""
+    script = "import sys\nfor i in range(50): print(f'line {i}')\nsys.exit(2)"
+
+    returncode, tail = await _run_with_output_tail_async(
+        [sys.executable, "-c", script], cwd=tmp_path, max_lines=5
+    )
+
+    assert returncode == 2
+    assert tail.splitlines() == [f"line {i}" for i in range(45, 50)]
+
+
+@pytest.mark.asyncio
+async def test_run_with_output_tail_async_handles_huge_line(tmp_path):
+    """Test a single line far beyond the stream reader's limit is read without error."""
+    script = "print('x' * 200_000)\nprint('done')"
+
+    returncode, tail = await _run_with_output_tail_async(
+        [sys.executable, "-c", script], cwd=tmp_path, max_lines=5
+    )
+
+    assert returncode == 0
+    lines = tail.splitlines()
+    assert lines[-1] == "done"
+    # Only the end of the over-long line is kept
+    assert set(lines[0]) == {"x"}
+    assert len(lines[0]) <= RENDER_OUTPUT_BUFFER_SIZE
+
+
+@pytest.mark.asyncio
+async def test_run_with_output_tail_async_kills_child_on_cancel(tmp_path):
+    """Test cancelling the coroutine kills and reaps the child process."""
+    import asyncio
+
+    procs = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def capture_proc(*args, **kwargs):
+        proc = await create_subprocess_exec(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    script = "import time\nprint('started', flush=True)\ntime.sleep(60)"
+    with patch("asyncio.create_subprocess_exec", side_effect=capture_proc):
+        task = asyncio.create_task(
+            _run_with_output_tail_async([sys.executable, "-c", script], cwd=tmp_path)
+        )
+        while not procs:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert procs[0].returncode is not None
+
+
+@pytest.mark.asyncio
+async def test_run_with_output_tail_async_read_error_raises_rendering_error(tmp_path):
+    """Test a failed read surfaces as RenderingError after killing the child."""
+    import asyncio
+
+    from movie_generator.exceptions import RenderingError
+
+    procs = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def capture_proc(*args, **kwargs):
+        proc = await create_subprocess_exec(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    script = "import time\ntime.sleep(60)"
+    with (
+        patch("asyncio.create_subprocess_exec", side_effect=capture_proc),
+        patch.object(asyncio.StreamReader, "read", side_effect=OSError("pipe broke")),
+    ):
+        with pytest.raises(RenderingError, match="pipe broke"):
+            await _run_with_output_tail_async([sys.executable, "-c", script], cwd=tmp_path)
+
+    assert procs[0].returncode is not None
+
+
+@pytest.mark.asyncio
+async def test_render_video_with_remotion_async_renders_and_reports_failure(tmp_path):
+    """Test the coroutine renders via the async runner and raises on a non-zero exit."""
+    from movie_generator.exceptions import RenderingError
+
+    composition_config = CompositionConfig(
+        phrases=[Phrase(text="Hello", duration=1.0, start_time=0.0)], audio_paths=[]
+    )
+    render_config = RenderConfig(output_path=tmp_path / "output.mp4", remotion_root=tmp_path)
+    runner = AsyncMock(return_value=(0, ""))
+
+    with (
+        patch(
+            "movie_generator.video.remotion_renderer._prepare_render",
+            return_value=render_config.output_path,
+        ),
+        patch("movie_generator.video.remotion_renderer._run_with_output_tail_async", runner),
+    ):
+        await render_video_with_remotion_async(composition_config, render_config)
+        command = runner.call_args[0][0]
+        assert command[command.index("VideoGenerator") + 1] == str(render_config.output_path)
+
+        runner.return_value = (1, "boom")
+        with pytest.raises(RenderingError, match="exit code 1"):
+            await render_video_with_remotion_async(composition_config, render_config)
+
+
+def test_render_video_with_remotion_wraps_coroutine(tmp_path):
+    """Test the blocking entry point runs the async implementation."""
+    composition_config = CompositionConfig(phrases=[], audio_paths=[])
+    render_config = RenderConfig(output_path=tmp_path / "output.mp4", remotion_root=tmp_path)
+
+    with patch(
+        "movie_generator.video.remotion_renderer.render_video_with_remotion_async",
+        new_callable=AsyncMock,
+    ) as mock_render:
+        render_video_with_remotion(composition_config, render_config)
+
+    mock_render.assert_awaited_once_with(composition_config, render_config)
+
+
 @pytest.mark.skip(reason="Requires Remotion installation and valid media files")
 def test_render_video_with_remotion_e2e():
     """End-to-end test for Remotion video rendering.
@@ -0,0 +1,177 @@
+"""Tests for the ffmpeg-based video renderer."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from movie_generator.script.phrases import Phrase
+from movie_generator.video.renderer import (
+    concat_list_line,
+    create_composition,
+    render_video,
+    save_composition,
+)
+
+
+def _write_composition(tmp_path: Path, audio_files: list[str], slides: list[str]) -> Path:
+    composition_path = tmp_path / "composition.json"
+    composition_path.write_text(
+        json.dumps(
+            {"fps": 30, "width": 640, "height": 360, "audio_files": audio_files, "slides": slides}
+        ),
+        encoding="utf-8",
+    )
+    return composition_path
+
+
+def test_render_video_muxes_concat_audio_in_single_ffmpeg_call(tmp_path):
+    """Test audio is concatenated and muxed with the slide in one ffmpeg pass."""
+    audio_files = []
+    for i in range(2):
+        audio = tmp_path / f"phrase_{i:04d}.wav"
+        audio.write_bytes(b"RIFF")
+        audio_files.append(str(audio))
+    slide = tmp_path / "slide_0000.png"
+    slide.write_bytes(b"PNG")
+    composition_path = _write_composition(tmp_path, audio_files, [str(slide)])
+    output_path = tmp_path / "out" / "video.mp4"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("subprocess.run") as mock_run,
+    ):
+        render_video(composition_path, output_path)
+
+    mock_run.assert_called_once()
+    command = mock_run.call_args[0][0]
+    assert command[command.index("-f") + 1] == "concat"
+    assert str(slide) in command
+    list_path = Path(command[command.index("concat") + 4])
+    assert list_path.parent.parent == output_path.parent
+    assert not list_path.parent.exists()
+    assert [p.name for p in output_path.parent.iterdir()] == ["video.mp4.sig"]
+
+
+def test_render_video_uses_single_audio_file_directly(tmp_path):
+    """Test a lone audio file is passed to ffmpeg without a concat list."""
+    audio = tmp_path / "phrase_0000.wav"
+    audio.write_bytes(b"RIFF")
+    slide = tmp_path / "slide_0000.png"
+    slide.write_bytes(b"PNG")
+    composition_path = _write_composition(tmp_path, [str(audio)], [str(slide)])
+    output_path = tmp_path / "video.mp4"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("subprocess.run") as mock_run,
+    ):
+        render_video(composition_path, output_path)
+
+    command = mock_run.call_args[0][0]
+    assert "concat" not in command
+    assert command[command.index("-preset") + 1] == "veryfast"
+    assert command[command.index("-crf") + 1] == "28"
+    assert command[command.index("-g") + 1] == "300"
+    assert command[command.index(str(audio)) - 1] == "-i"
+
+
+def test_create_composition_maps_slides_by_section_index():
+    """Test slides are matched to phrases by the section index in their filename."""
+    phrases = [Phrase(text="A", duration=1.0), Phrase(text="B", duration=1.0)]
+    for i, p in enumerate(phrases):
+        p.original_index = i
+        p.section_index = i
+    slide_paths = [Path("slides/ja/slide_0001.png"), Path("slides/ja/cover.png")]
+
+    composition = create_composition("t", phrases, slide_paths, [])
+
+    assert composition.phrases[0].slideFile is None
+    assert composition.phrases[1].slideFile == "slides/ja/slide_0001.png"
+    assert composition.phrases[1].audioFile == "audio/phrase_0001.wav"
+
+
+def test_save_composition_round_trips(tmp_path):
+    """Test saved composition.json matches the model and keeps non-ASCII text."""
+    phrase = Phrase(text="こんにちは", duration=1.5)
+    composition = create_composition("タイトル", [phrase], [], [Path("audio/phrase_0000.wav")])
+    output_path = tmp_path / "composition.json"
+
+    save_composition(composition, output_path)
+
+    raw = output_path.read_text(encoding="utf-8")
+    assert "こんにちは" in raw
+    assert json.loads(raw) == composition.model_dump()
+
+
+def test_concat_list_line_escapes_single_quotes():
+    """Test quotes in paths are escaped for ffmpeg's concat demuxer."""
+    assert concat_list_line("/a/b.wav") == "file '/a/b.wav'\n"
+    assert concat_list_line(Path("/a/it's.wav")) == "file '/a/it'\\''s.wav'\n"
+
+
+def test_render_video_reuses_black_placeholder_without_ffmpeg(tmp_path):
+    """Test renders without slides use an in-process black PNG instead of spawning ffmpeg."""
+    from PIL import Image
+
+    from movie_generator.video.renderer import _black_png
+
+    audio = tmp_path / "phrase_0000.wav"
+    audio.write_bytes(b"RIFF")
+    composition_path = _write_composition(tmp_path, [str(audio)], [])
+    image_paths = []
+    image_sizes = []
+
+    def fake_ffmpeg(command, **kwargs):
+        image_path = Path(command[command.index("-loop") + 5])
+        image_paths.append(image_path)
+        with Image.open(image_path) as image:
+            image_sizes.append(image.size)
+        return Mock(returncode=0)
+
+    _black_png.cache_clear()
+    with (
+        patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("subprocess.run", side_effect=fake_ffmpeg) as mock_run,
+    ):
+        render_video(composition_path, tmp_path / "a.mp4")
+        render_video(composition_path, tmp_path / "b.mp4")
+
+    assert mock_run.call_count == 2  # one mux per render, no placeholder generation
+    assert image_sizes == [(640, 360), (640, 360)]
+    assert _black_png.cache_info().misses == 1
+    # Written inside each render's private temp directory next to the output
+    assert all(path.parent.parent == tmp_path for path in image_paths)
+    assert not any(path.exists() for path in image_paths)
+
+
+def test_existing_files_filters_missing_paths_in_order(tmp_path):
+    """Test existence filtering via directory listings keeps order and drops missing files."""
+    from movie_generator.video.renderer import _existing_files
+
+    (tmp_path / "b.wav").touch()
+    (tmp_path / "a.wav").touch()
+    paths = [str(tmp_path / "b.wav"), str(tmp_path / "missing.wav"), str(tmp_path / "a.wav")]
+
+    assert _existing_files(paths) == [paths[0], paths[2]]
+    assert _existing_files([str(tmp_path / "nodir" / "x.wav")]) == []
+
+
+def test_render_video_skips_only_when_composition_signature_matches(tmp_path):
+    """Test an existing video is reused only if it was rendered from the same composition."""
+    audio = tmp_path / "phrase_0000.wav"
+    audio.write_bytes(b"RIFF")
+    composition_path = _write_composition(tmp_path, [str(audio)], [])
+    output_path = tmp_path / "video.mp4"
+    output_path.write_bytes(b"stale")
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("subprocess.run") as mock_run,
+    ):
+        render_video(composition_path, output_path)  # no sidecar yet: render
+        render_video(composition_path, output_path)  # signature matches: skip
+        _write_composition(tmp_path, [str(audio)], ["slide_0000.png"])
+        render_video(composition_path, output_path)  # composition changed: render
+
+    assert mock_run.call_count == 2
+    assert (tmp_path / "video.mp4.sig").exists()